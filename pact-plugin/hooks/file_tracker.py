@@ -8,6 +8,10 @@ Used by: hooks.json PostToolUse hook (matcher: Edit|Write)
 Non-blocking (PostToolUse cannot block). Warns via additionalContext when
 a different agent has already edited the same file.
 
+The tracking file (``file-edits.json``) is append-only JSONL: one compact
+JSON object per line. Legacy JSON-array files are still read, and are
+migrated to JSONL on the next append.
+
 Input: JSON from stdin with tool_input.file_path
 Output: JSON with additionalContext warning if conflict detected
 """
@@ -15,13 +19,20 @@ Output: JSON with additionalContext warning if conflict detected
 from __future__ import annotations
 
 import json
+import mmap
 import os
 import sys
 import time
 from pathlib import Path
+from typing import Iterator
 
 import shared.pact_context as pact_context
-from shared.pact_context import get_session_id, get_team_name, resolve_agent_name
+from shared.pact_context import (
+    get_project_dir,
+    get_session_id,
+    get_team_name,
+    resolve_agent_name,
+)
 from shared.paths import get_claude_config_dir
 
 try:
@@ -30,6 +41,39 @@ try:
 except ImportError:
     HAS_FLOCK = False
 
+# Compact record encoder, built once. json.dumps() only reuses its cached
+# encoder for all-default arguments; with separators= it constructs a fresh
+# JSONEncoder on every call. ensure_ascii stays on: a path carrying
+# surrogate-escaped bytes must still encode to valid UTF-8.
+_json_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+# Upper bound on distinct OTHER editor instances check_conflict collects
+# before it stops scanning. One foreign editor is enough to warn; naming the
+# three most recent keeps the message informative and bounded while the scan
+# returns as soon as they are found, O(recent edits) on long sessions.
+_MAX_CONFLICT_EDITORS = 3
+
+# How far (in ms) an entry may be older than since_ts before
+# get_environment_delta's newest-first walk stops. Lines are appended in
+# near, not strict, ts order: track_edit stamps ts before appending, and
+# concurrent hook processes can land their lines out of order.
+_DELTA_REORDER_MARGIN_MS = 5_000
+
+# Size-triggered compaction of the tracking log. Once an append leaves the
+# file above _COMPACT_THRESHOLD_BYTES it is rewritten keeping only entries
+# from the last _COMPACT_KEEP_SECONDS, capped at the newest
+# _COMPACT_KEEP_ENTRIES (~300KB at typical line sizes — well under the
+# threshold, so compaction does not re-fire on the next append).
+_COMPACT_THRESHOLD_BYTES = 1024 * 1024
+_COMPACT_KEEP_SECONDS = 24 * 60 * 60
+_COMPACT_KEEP_ENTRIES = 2_000
+
+# Portable single-write atomicity bound (PIPE_BUF is 512 bytes on macOS).
+# A record at or under this size is appended with one O_APPEND os.write and
+# no flock — the kernel keeps concurrent appends from interleaving. Same
+# bound as session_registry._MAX_LINE_BYTES.
+_MAX_ATOMIC_LINE_BYTES = 512
+
 # Suppress false "hook error" display in Claude Code UI on bare exit paths
 _SUPPRESS_OUTPUT = json.dumps({"suppressOutput": True})
 
@@ -44,6 +88,69 @@ def _normalize_path(file_path: str) -> str:
     return os.path.realpath(file_path)
 
 
+def _repo_root(start: str) -> str:
+    """Return the main git checkout containing ``start`` (normalized), or ''.
+
+    Walks up to the nearest ``.git`` with plain stat calls (no git
+    subprocess in a per-edit hook). A ``.git`` FILE marks a linked worktree;
+    its ``gitdir: <main>/.git/worktrees/<name>`` pointer is followed back to
+    the main checkout, which is where worktree-setup puts ``.worktrees/``.
+    """
+    current = start
+    while True:
+        git_path = os.path.join(current, ".git")
+        if os.path.isdir(git_path):
+            return current
+        if os.path.isfile(git_path):
+            try:
+                with open(git_path, encoding="utf-8") as f:
+                    pointer = f.read().strip()
+            except OSError:
+                return current
+            if not pointer.startswith("gitdir:"):
+                return current
+            gitdir = _normalize_path(
+                os.path.join(current, pointer[len("gitdir:"):].strip())
+            )
+            marker = os.sep + os.path.join(".git", "worktrees") + os.sep
+            main_root, sep, _ = gitdir.partition(marker)
+            return main_root if sep else current
+        parent = os.path.dirname(current)
+        if parent == current:
+            return ""
+        current = parent
+
+
+def _is_within(file_path: str, root: str) -> bool:
+    """True if normalized ``file_path`` is ``root`` or lies beneath it."""
+    try:
+        return os.path.commonpath([root, file_path]) == root
+    except ValueError:
+        # Different drives (Windows) or mixed absolute/relative.
+        return False
+
+
+def _is_project_file(file_path: str, project_dir: str) -> bool:
+    """True if ``file_path`` (already normalized) lies inside the project.
+
+    Inside means under ``project_dir`` or under the git repo root's
+    ``.worktrees/`` — worktree-setup creates worktrees at
+    ``$REPO_ROOT/.worktrees/``, which is outside ``project_dir`` whenever the
+    project is a subdirectory of the repo. An empty ``project_dir`` (context
+    unavailable) admits every path — the gate only narrows tracking when the
+    project root is actually known.
+    """
+    if not project_dir:
+        return True
+    root = _normalize_path(project_dir)
+    if _is_within(file_path, root):
+        return True
+    repo_root = _repo_root(root)
+    return bool(repo_root) and _is_within(
+        file_path, os.path.join(repo_root, ".worktrees")
+    )
+
+
 def track_edit(
     file_path: str,
     agent_name: str,
@@ -63,8 +170,20 @@ def track_edit(
     human-readable LABEL (the friendly-name recovery for the label under tmux
     is a deferred follow-up; detection-uniqueness is what this fix restores).
     """
-    file_path = _normalize_path(file_path)
-    tracking_file = Path(tracking_path)
+    _append_edit(
+        _normalize_path(file_path), agent_name, tool_name,
+        Path(tracking_path), session_id,
+    )
+
+
+def _append_edit(
+    file_path: str,
+    agent_name: str,
+    tool_name: str,
+    tracking_file: Path,
+    session_id: str,
+) -> None:
+    """track_edit body for an already-normalized ``file_path``."""
     tracking_file.parent.mkdir(parents=True, exist_ok=True)
 
     new_entry = {
@@ -72,35 +191,207 @@ def track_edit(
         "agent": agent_name,
         "session_id": session_id,
         "tool": tool_name,
-        "ts": int(time.time()),
+        # Milliseconds since the epoch: time_ns() is an exact int (no float
+        # round-trip) and ms resolution orders back-to-back edits that
+        # second-resolution timestamps collapsed together.
+        "ts": time.time_ns() // 1_000_000,
     }
-
-    # Use file locking to prevent concurrent write corruption
-    if HAS_FLOCK:
-        with open(tracking_file, "a+") as f:
+    # JSONL: one compact record per line, appended in O(1) bytes. The prior
+    # read-whole-array/rewrite-whole-array shape was O(n) per edit (O(n^2)
+    # over a long session).
+    line = (_json_dumps(new_entry) + "\n").encode("utf-8")
+
+    # Fast path: one lock-free O_APPEND write for the common case.
+    if HAS_FLOCK and len(line) <= _MAX_ATOMIC_LINE_BYTES:
+        if _try_atomic_append(tracking_file, line):
+            return
+
+    # Slow path (legacy migration, torn tail, compaction due, oversize line,
+    # no fcntl): use file locking to prevent concurrent write corruption.
+    # buffering=0 hands back the raw FileIO — no BufferedRandom layer to
+    # build and flush for what is a handful of direct reads and writes.
+    with open(tracking_file, "a+b", buffering=0) as f:
+        if HAS_FLOCK:
             fcntl.flock(f, fcntl.LOCK_EX)
-            try:
-                f.seek(0)
-                content = f.read()
-                try:
-                    entries = json.loads(content) if content.strip() else []
-                except (json.JSONDecodeError, IOError):
-                    entries = []
-                entries.append(new_entry)
-                f.seek(0)
-                f.truncate()
-                f.write(json.dumps(entries))
-            finally:
+        try:
+            _append_line(f, line)
+        finally:
+            if HAS_FLOCK:
                 fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _try_atomic_append(tracking_file: Path, line: bytes) -> bool:
+    """Append ``line`` with a single lock-free O_APPEND write, if safe.
+
+    Returns False without writing when the file needs the locked path: a
+    legacy JSON-array file (first byte ``[``), a tail without a trailing
+    newline, or an append that would cross ``_COMPACT_THRESHOLD_BYTES``.
+    The two probe bytes are read with ``os.pread`` on the same fd, so the
+    happy path is open + fstat + write + close with no lock round-trip.
+
+    Known window: a lock-free append that lands while another process is
+    compacting (between its read and its truncate) is dropped. Compaction
+    fires at most once per ~1 MiB of edits and the log is advisory, so this
+    is accepted rather than paying two flock calls on every edit.
+    """
+    fd = os.open(
+        str(tracking_file), os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644
+    )
+    try:
+        size = os.fstat(fd).st_size
+        if size:
+            if size + len(line) > _COMPACT_THRESHOLD_BYTES:
+                return False
+            if os.pread(fd, 1, 0) == b"[" or os.pread(fd, 1, size - 1) != b"\n":
+                return False
+        os.write(fd, line)  # single <=PIPE_BUF write → atomic, no lock
+        return True
+    finally:
+        os.close(fd)
+
+
+def _append_line(f, line: bytes) -> None:
+    """Append one JSONL record to an open unbuffered ``a+b`` tracking file.
+
+    Performs the one-shot legacy migration: a file whose first byte is ``[``
+    is a pre-JSONL JSON array and is rewritten in place as JSONL before the
+    append (an unparseable legacy array is discarded, matching the prior
+    "corrupt file treated as empty" behavior). A file whose last byte is not
+    a newline (torn write, hand-edited garbage) gets a separating newline so
+    the new record lands on its own line. An append that leaves the file
+    above ``_COMPACT_THRESHOLD_BYTES`` triggers ``_compact``.
+    """
+    f.seek(0)
+    if f.read(1) == b"[":
+        f.seek(0)
+        try:
+            legacy = json.loads(f.read())
+        except ValueError:
+            legacy = []
+        f.truncate(0)
+        if isinstance(legacy, list):
+            _write_all(f, b"".join(
+                (_json_dumps(entry) + "\n").encode("utf-8")
+                for entry in legacy
+                if isinstance(entry, dict)
+            ))
     else:
-        entries = []
-        if tracking_file.exists():
+        size = f.seek(0, os.SEEK_END)
+        if size:
+            f.seek(size - 1)
+            if f.read(1) != b"\n":
+                line = b"\n" + line
+    _write_all(f, line)
+    if f.tell() > _COMPACT_THRESHOLD_BYTES:
+        _compact(f)
+
+
+def _compact(f) -> None:
+    """Rewrite an open unbuffered ``a+b`` tracking file keeping only recent
+    entries.
+
+    Keeps lines whose ``ts`` is within ``_COMPACT_KEEP_SECONDS`` of now,
+    then at most the newest ``_COMPACT_KEEP_ENTRIES`` of those; blank and
+    unparseable lines are dropped. Kept lines are copied verbatim (no
+    re-serialization). The rewrite is in place through the caller's fd, so
+    it happens under the caller's flock — a tmp-file + os.replace swap
+    would let a writer blocked on the OLD inode's lock append to the
+    unlinked file after the swap.
+    """
+    cutoff = time.time_ns() // 1_000_000 - _COMPACT_KEEP_SECONDS * 1000
+    kept: list[bytes] = []
+    f.seek(0)
+    # One readall + split: line iteration on a raw FileIO would read a
+    # byte at a time.
+    for raw in f.read().splitlines(keepends=True):
+        if not raw.strip():
+            continue
+        try:
+            entry = json.loads(raw)
+        except ValueError:
+            continue
+        if not isinstance(entry, dict):
+            continue
+        ts = entry.get("ts")
+        if isinstance(ts, (int, float)) and ts >= cutoff:
+            kept.append(raw if raw.endswith(b"\n") else raw + b"\n")
+    f.truncate(0)
+    _write_all(f, b"".join(kept[-_COMPACT_KEEP_ENTRIES:]))
+
+
+def _write_all(f, data: bytes) -> None:
+    """Write ``data`` fully through a raw (unbuffered) file object.
+
+    A raw ``write`` is a single syscall and may return a short count; loop
+    until every byte is written.
+    """
+    view = memoryview(data)
+    while view:
+        view = view[f.write(view):]
+
+
+def _load_entries(tracking_file: Path) -> list[dict]:
+    """Parse the tracking file into a list of entry dicts.
+
+    Reads JSONL (one object per line), skipping blank and unparseable lines
+    so a single torn record cannot hide the rest of the log. A legacy
+    JSON-array file (first byte ``[``) is parsed whole; if it is corrupt the
+    result is empty.
+    """
+    entries: list[dict] = []
+    with open(tracking_file, "rb") as f:
+        if f.read(1) == b"[":
+            f.seek(0)
+            try:
+                legacy = json.loads(f.read())
+            except ValueError:
+                return []
+            if not isinstance(legacy, list):
+                return []
+            return [entry for entry in legacy if isinstance(entry, dict)]
+        f.seek(0)
+        for line in f:
+            if not line.strip():
+                continue
             try:
-                entries = json.loads(tracking_file.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, IOError):
-                entries = []
-        entries.append(new_entry)
-        tracking_file.write_text(json.dumps(entries), encoding="utf-8")
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict):
+                entries.append(entry)
+    return entries
+
+
+def _iter_entries_reverse(tracking_file: Path) -> Iterator[dict]:
+    """Yield tracking entries newest-first, decoding lines lazily.
+
+    The JSONL log is mmapped and walked backwards with ``rfind(b"\\n")`` so
+    a caller that stops early (``check_conflict`` once it has enough
+    editors, ``get_environment_delta`` once it is well past ``since_ts``) only
+    pays for the tail of the file. Blank and unparseable lines are skipped.
+    A legacy JSON-array file is parsed whole and yielded in reverse.
+    """
+    with open(tracking_file, "rb") as f:
+        if f.read(1) == b"[":
+            yield from reversed(_load_entries(tracking_file))
+            return
+        # mmap rejects zero-length files.
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)
+            while end > 0:
+                nl = mm.rfind(b"\n", 0, end)
+                line = mm[nl + 1:end]
+                end = nl
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict):
+                    yield entry
 
 
 def check_conflict(
@@ -124,34 +415,46 @@ def check_conflict(
     with a short session_id suffix so the message names two distinct editors
     rather than a confusing repeated name.
     """
-    file_path = _normalize_path(file_path)
+    return _find_conflict(
+        _normalize_path(file_path), agent_name, Path(tracking_path), session_id
+    )
+
+
+def _find_conflict(
+    file_path: str,
+    agent_name: str,
+    tracking_file: Path,
+    session_id: str,
+) -> str | None:
+    """check_conflict body for an already-normalized ``file_path``."""
     if not agent_name:
         return None
 
-    tracking_file = Path(tracking_path)
     if not tracking_file.exists():
         return None
 
-    try:
-        entries = json.loads(tracking_file.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, IOError):
-        return None
-
     self_key = (agent_name, session_id)
     # Collect the distinct OTHER editor instances (composite key) and, per
     # agent label, the set of session_ids seen — so the label can be
     # disambiguated only when a name is genuinely shared across instances.
+    # Scanned newest-first and capped, so the most recent editors are the
+    # ones named and the scan stops early on long logs.
     other_keys: set[tuple[str, str]] = set()
     sessions_by_agent: dict[str, set[str]] = {}
-    for entry in entries:
-        if entry.get("file") != file_path:
-            continue
-        entry_agent = entry.get("agent", "")
-        entry_session = entry.get("session_id", "")
-        if (entry_agent, entry_session) == self_key:
-            continue
-        other_keys.add((entry_agent, entry_session))
-        sessions_by_agent.setdefault(entry_agent, set()).add(entry_session)
+    try:
+        for entry in _iter_entries_reverse(tracking_file):
+            if entry.get("file") != file_path:
+                continue
+            entry_agent = entry.get("agent", "")
+            entry_session = entry.get("session_id", "")
+            if (entry_agent, entry_session) == self_key:
+                continue
+            other_keys.add((entry_agent, entry_session))
+            sessions_by_agent.setdefault(entry_agent, set()).add(entry_session)
+            if len(other_keys) >= _MAX_CONFLICT_EDITORS:
+                break
+    except OSError:
+        return None
 
     if not other_keys:
         return None
@@ -184,25 +487,39 @@ def get_environment_delta(
     detect environment drift when dispatching or briefing agents.
 
     Note: Uses inclusive boundary (>=) — entries AT exactly since_ts are included.
+
+    Timestamps are compared opaquely; ``track_edit`` records ``ts`` in
+    milliseconds since the epoch, so ``since_ts`` should be in ms too
+    (e.g. ``time.time_ns() // 1_000_000``). Entries written before the
+    switch carry whole seconds and therefore sort older than any ms value.
     """
     tracking_file = Path(tracking_path)
     if not tracking_file.exists():
         return {}
 
+    # Walk newest-first: the first qualifying entry seen for a file is its
+    # latest editor. Appends are only roughly ts-ordered (see
+    # _DELTA_REORDER_MARGIN_MS), so an older entry is skipped and the walk
+    # stops only past the margin; an entry without an int ts never stops it.
+    delta: dict[str, str] = {}
     try:
-        entries = json.loads(tracking_file.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, IOError):
+        for entry in _iter_entries_reverse(tracking_file):
+            ts = entry.get("ts")
+            if not isinstance(ts, int):
+                ts = 0
+            elif ts < since_ts - _DELTA_REORDER_MARGIN_MS:
+                break
+            if ts < since_ts:
+                continue
+            file_path = entry.get("file")
+            agent = entry.get("agent")
+            if not file_path or not agent:
+                continue
+            if agent != requesting_agent:
+                delta.setdefault(file_path, agent)
+    except OSError:
         return {}
 
-    delta: dict[str, str] = {}
-    for entry in entries:
-        file_path = entry.get("file")
-        agent = entry.get("agent")
-        if not file_path or not agent:
-            continue
-        if entry.get("ts", 0) >= since_ts and agent != requesting_agent:
-            delta[file_path] = agent
-
     return delta
 
 
@@ -224,6 +541,18 @@ def main():
         print(_SUPPRESS_OUTPUT)
         sys.exit(0)
 
+    # Resolve the path once; the scope gate, the conflict scan and the
+    # append below all share it (and the tracking-file Path) rather than
+    # each re-running realpath.
+    file_path = _normalize_path(file_path)
+
+    # Edits outside the project (scratch files under /tmp, ~/.claude memory,
+    # other checkouts) cannot become a merge conflict between teammates —
+    # skip them before reading or appending the tracking file.
+    if not _is_project_file(file_path, get_project_dir()):
+        print(_SUPPRESS_OUTPUT)
+        sys.exit(0)
+
     agent_name = resolve_agent_name(input_data)
     tool_name = input_data.get("tool_name", "")
     # NEW-1 (#878): session_id is the per-instance uniqueness component of the
@@ -231,18 +560,18 @@ def main():
     # resolve_agent_name is KEPT for the human-readable label.
     session_id = get_session_id()
 
-    tracking_path = str(
+    tracking_file = (
         get_claude_config_dir() / "teams" / team_name / "file-edits.json"
     )
 
     # Check for conflict BEFORE recording this edit. Pass the same
     # (agent_name, session_id) composite so this instance's own prior edits are
     # excluded but a different instance's are detected.
-    conflict = check_conflict(file_path, agent_name, tracking_path, session_id)
+    conflict = _find_conflict(file_path, agent_name, tracking_file, session_id)
 
     # Record this edit
-    track_edit(
-        file_path, agent_name or "orchestrator", tool_name, tracking_path,
+    _append_edit(
+        file_path, agent_name or "orchestrator", tool_name, tracking_file,
         session_id,
     )
 
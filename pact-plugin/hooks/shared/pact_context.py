@@ -12,6 +12,7 @@ See: docs/architecture/pact-context-module.md for full design rationale.
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 import re
@@ -39,6 +40,10 @@ from .paths import get_claude_config_dir
 # is the SESSION_ID_CONTROL_CHARS_RE strip applied below in init().
 _UNSAFE_SLUG_CHARS_RE = re.compile(r"[^A-Za-z0-9_-]+")
 
+# Team-name suffix allowlist for generate_team_name: everything outside
+# lowercase hex + hyphen is dropped from the session_id[:8] prefix.
+_NON_TEAM_SUFFIX_CHARS_RE = re.compile(r"[^a-f0-9-]")
+
 # Session-scoped context file path, set by init().
 # When None, get_pact_context() returns _EMPTY_CONTEXT (no file to read).
 # Note: pact_session.py (in skills/pact-memory/scripts/) mirrors this logic
@@ -115,11 +120,15 @@ def reset_for_tests() -> None:
     ``TOKEN_*`` / config constants are immutable defaults and are not touched.
     ADDITIVE: production caching behavior and all existing callers are
     unchanged; this is invoked only by tests.
+
+    Also clears the ``_parse_team_config`` memo so a team config parsed in
+    one test is never served to the next.
     """
     global _cache, _context_path, _aligned_cache
     _cache = None
     _context_path = None
     _aligned_cache = None
+    _parse_team_config.cache_clear()
 
 
 def _build_session_path(slug: str, session_id: str) -> Path:
@@ -353,7 +362,7 @@ def _resolve_aligned_team_name(
         branch composes the teams root via home).
       * ``Path(teams_dir)`` raises ``TypeError`` when ``teams_dir`` is a
         non-``None`` non-str (e.g. an int) — a path cannot be composed from it.
-      * the per-entry ``config.json`` read (``read_text`` / ``json.loads`` /
+      * the per-entry ``config.json`` read (``read_bytes`` / ``json.loads`` /
         ``is_dir``) can raise ``OSError`` / ``json.JSONDecodeError`` /
         ``ValueError`` — but those are caught by the INNER typed
         ``except`` (skip the bad sibling, keep scanning), so they normally do
@@ -377,8 +386,8 @@ def _resolve_aligned_team_name(
 
     PERF (SessionStart hot-path scan cost): on a MATCH the scan stops at the
     first matching dir; on NO MATCH it iterates EVERY team dir under
-    ``teams/``, doing a ``stat``/``is_dir`` plus a small-JSON ``read_text`` +
-    ``json.loads`` per entry. Acceptable: the directory holds a handful of
+    ``teams/``, doing a ``DirEntry.is_dir`` (no stat for plain dirs) plus a
+    small-JSON ``read_bytes`` + parse per entry. Acceptable: the directory holds a handful of
     entries in practice (worst case observed ~0.45ms over ~21 dirs), the
     no-match path is hit only in the cold-start window (the real team dir is
     born ~38s after SessionStart), and each fresh hook process pays it at most
@@ -410,13 +419,17 @@ def _resolve_aligned_team_name(
         else:
             teams_root = get_claude_config_dir() / "teams"
         # Sorted iteration -> deterministic resolution if (pathologically)
-        # two dirs claimed the same leadSessionId.
-        for entry in sorted(teams_root.iterdir()):
+        # two dirs claimed the same leadSessionId. os.scandir's DirEntry
+        # answers is_dir() from the getdents d_type — no per-entry stat
+        # (symlinked entries still stat, preserving the follow semantics).
+        with os.scandir(teams_root) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
             try:
                 if not entry.is_dir():
                     continue
-                config_path = entry / "config.json"
-                data = json.loads(config_path.read_text(encoding="utf-8"))
+                config_path = Path(entry.path) / "config.json"
+                data = json.loads(config_path.read_bytes())
                 if data.get("leadSessionId") != session_id:
                     continue
                 # Path-safety the matched dir name BEFORE returning it — a
@@ -667,7 +680,7 @@ def generate_team_name(input_data: dict) -> str:
     raw_id = input_data.get("session_id")
     session_id = str(raw_id) if raw_id else ""
     if session_id:
-        suffix = re.sub(r"[^a-f0-9-]", "", session_id[:8]) or secrets.token_hex(4)
+        suffix = _NON_TEAM_SUFFIX_CHARS_RE.sub("", session_id[:8]) or secrets.token_hex(4)
     else:
         suffix = secrets.token_hex(4)
     return f"session-{suffix}"
@@ -906,6 +919,33 @@ def classify_session_role(input_data: dict) -> str:
     return "unknown"
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_team_config(path: str, mtime_ns: int, size: int) -> object:
+    """Parse a team config.json, memoized on ``(path, mtime_ns, size)``.
+
+    The stat fields are part of the key purely so a rewritten config misses
+    the cache; they are not read here. Exceptions are not cached.
+    """
+    return json.loads(Path(path).read_bytes())
+
+
+def load_team_config(config_path: Path) -> object:
+    """Return the parsed JSON of a team ``config.json``.
+
+    One hook process typically reads the same config several times (peer
+    list, leadSessionId, member lookup); this stats the file and serves the
+    parsed value from a small LRU (last 8 configs) while the file's mtime
+    and size are unchanged. The returned object is SHARED between callers
+    and must be treated as read-only.
+
+    Raises whatever the stat/read/parse raises (OSError, ValueError) —
+    callers keep their own fail-open handling. The top-level value is not
+    shape-checked.
+    """
+    st = os.stat(config_path)
+    return _parse_team_config(str(config_path), st.st_mtime_ns, st.st_size)
+
+
 def _read_lead_session_id(team_name: str, teams_dir: str | None = None) -> str:
     """Read the top-level ``leadSessionId`` from
     ``~/.claude/teams/{team_name}/config.json``.
@@ -937,7 +977,7 @@ def _read_lead_session_id(team_name: str, teams_dir: str | None = None) -> str:
     else:
         config_path = get_claude_config_dir() / "teams" / team_name / "config.json"
     try:
-        data = json.loads(config_path.read_text(encoding="utf-8"))
+        data = load_team_config(config_path)
         lead_session_id = data.get("leadSessionId")
     except (OSError, json.JSONDecodeError, ValueError, AttributeError, TypeError):
         return ""
@@ -1037,7 +1077,7 @@ def _iter_members(
             get_claude_config_dir() / "teams" / team_name / "config.json"
         )
     try:
-        data = json.loads(config_path.read_text(encoding="utf-8"))
+        data = load_team_config(config_path)
         members = data.get("members")
     except (OSError, json.JSONDecodeError, ValueError, AttributeError, TypeError):
         return []
@@ -35,14 +35,19 @@ def get_claude_config_dir(env=None, home=None) -> Path:
 
     Returns an UNRESOLVED path — the single .resolve() stays at the call sites
     that perform containment checks. NO expanduser/lstrip/removeprefix.
+
+    Deliberately NOT memoized (a process-lifetime cache would defeat the
+    monkeypatch-safety above); instead ``Path.home()`` — two Path
+    constructions plus an expanduser — is only evaluated on the branches
+    that actually use it, so an absolute $CLAUDE_CONFIG_DIR costs one Path.
     """
     env = os.environ if env is None else env
-    home = Path.home() if home is None else home
     raw = (env.get("CLAUDE_CONFIG_DIR") or "").strip()
+    if raw and not (raw == "~" or raw.startswith("~/")):
+        return Path(raw)
+    home = Path.home() if home is None else home
     if not raw:
         return home / ".claude"
     if raw == "~":
         return home
-    if raw.startswith("~/"):
-        return home / raw[2:]          # exact 2-char prefix — NOT lstrip, NOT removeprefix
-    return Path(raw)
+    return home / raw[2:]              # exact 2-char prefix — NOT lstrip, NOT removeprefix
@@ -26,6 +26,7 @@ from pathlib import Path
 
 from shared.plugin_manifest import format_plugin_banner
 from shared.paths import get_claude_config_dir
+from shared.pact_context import load_team_config
 
 
 _TEACHBACK_REMINDER = (
@@ -68,6 +69,12 @@ _CHARTER_CROSSREF_LINE = (
 _BOOTSTRAP_PRELUDE_TEMPLATE = _ROLE_MARKER_TEMPLATE + _CHARTER_CROSSREF_LINE
 
 
+# Characters _sanitize_agent_name replaces with "_": C0 controls, DEL, and
+# the Unicode line terminators NEL / LINE SEPARATOR / PARAGRAPH SEPARATOR.
+# Compiled once at import — the sanitizer runs per team member per spawn.
+_AGENT_NAME_UNSAFE_CHARS_RE = re.compile(r"[\x00-\x1f\x7f\u0085\u2028\u2029]")
+
+
 def _sanitize_agent_name(agent_name: str) -> str:
     """Strip characters from agent_name that could break out of the
     PACT ROLE marker format.
@@ -101,7 +108,7 @@ def _sanitize_agent_name(agent_name: str) -> str:
     # template (see security-engineer memory
     # patterns_symmetric_sanitization.md). Matches the sibling filter
     # in session_state._sanitize_rendered_string.
-    sanitized = re.sub(r"[\x00-\x1f\x7f\u0085\u2028\u2029]", "_", agent_name)
+    sanitized = _AGENT_NAME_UNSAFE_CHARS_RE.sub("_", agent_name)
     return sanitized.replace(")", "_")
 
 
@@ -154,7 +161,7 @@ def get_peer_context(
         return None
 
     try:
-        config = json.loads(config_path.read_text(encoding="utf-8"))
+        config = load_team_config(config_path)
     except (json.JSONDecodeError, IOError):
         return None
 
@@ -178,27 +185,32 @@ def get_peer_context(
         # marker or line break into the peer list; and the exclusion now
         # compares sanitized-vs-sanitized (closing the self-exclusion gap
         # under a hostile self name). Normal names are sanitize-invariant, so
-        # this is byte-identical for ordinary configs.
-        peers = [
-            _sanitize_agent_name(m["name"])
-            for m in members
-            if _sanitize_agent_name(m["name"]) != safe_name
-        ]
+        # this is byte-identical for ordinary configs. Each member name is
+        # sanitized once; join() gets a list comprehension (it materializes
+        # a generator into a list anyway).
+        peer_list = ", ".join([
+            name
+            for name in map(_sanitize_agent_name, (m["name"] for m in members))
+            if name != safe_name
+        ])
     else:
         # Fallback: filter by agentType. This excludes ALL agents of the same
         # type, not just the spawning agent. This is a known limitation when
         # the hook input does not include agent_name/agent_id. O2 (#806):
-        # the emitted peer name is sanitized here too.
-        peers = [
+        # the emitted peer name is sanitized here too. agentType is not
+        # guaranteed by the config schema, hence .get(). List comprehension
+        # for join(), as above.
+        peer_list = ", ".join([
             _sanitize_agent_name(m["name"])
             for m in members
             if m.get("agentType") != agent_type
-        ]
+        ])
 
-    if not peers:
+    # _sanitize_agent_name never returns "" (falsy → "unknown"), so an
+    # empty join means no peers.
+    if not peer_list:
         peer_context = "You are the only active teammate on this team."
     else:
-        peer_list = ", ".join(peers)
         peer_context = (
             f"Active teammates on your team: {peer_list}\n"
             f"You can message them via SendMessage for shared artifacts or blocking questions."
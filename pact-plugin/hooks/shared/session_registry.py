@@ -85,15 +85,15 @@ def _config_root() -> Path:
     through this one copy, or ``register()``'s ``_is_under_pact_sessions`` gate
     fail-closes under a non-default CLAUDE_CONFIG_DIR (silent name-recovery loss).
     """
-    home = Path.home()
     raw = (os.environ.get("CLAUDE_CONFIG_DIR") or "").strip()
+    if raw and not (raw == "~" or raw.startswith("~/")):
+        return Path(raw)
+    home = Path.home()
     if not raw:
         return home / ".claude"
     if raw == "~":
         return home
-    if raw.startswith("~/"):
-        return home / raw[2:]
-    return Path(raw)
+    return home / raw[2:]
 
 
 def get_registry_path() -> Path:
@@ -106,6 +106,10 @@ def get_registry_path() -> Path:
 # no flock — the OS writes it atomically even under concurrent O_APPEND.
 _MAX_LINE_BYTES = 512
 
+# INLINE COPY of peer_context._AGENT_NAME_UNSAFE_CHARS_RE — see
+# _sanitize_agent_name below; the char-class literals must stay identical.
+_AGENT_NAME_UNSAFE_CHARS_RE = re.compile(r"[\x00-\x1f\x7f\u0085\u2028\u2029]")
+
 
 def _sanitize_agent_name(name: str) -> str:
     """Strip characters that could break out of the name@team value or the
@@ -125,7 +129,7 @@ def _sanitize_agent_name(name: str) -> str:
     """
     if not name:
         return "unknown"
-    sanitized = re.sub(r"[\x00-\x1f\x7f\u0085\u2028\u2029]", "_", name)
+    sanitized = _AGENT_NAME_UNSAFE_CHARS_RE.sub("_", name)
     return sanitized.replace(")", "_")
 
 
@@ -17,12 +17,15 @@ and under the 500-line maintainability limit.
 
 from __future__ import annotations
 
+import bisect
+import functools
+import json
 import os
 import re
 import subprocess
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from shared.claude_md_manager import (
     PACT_BOUNDARY_PREFIXES,
@@ -40,6 +43,23 @@ from pin_caps import (
 # defined in one place.
 _BOUNDARY_ALT = "|".join(PACT_BOUNDARY_PREFIXES)
 
+# Patterns compiled once at import; SessionStart runs each of them per call.
+# "## Pinned Context" heading that opens the pinned section.
+_PINNED_HEADER_RE = re.compile(r'^## Pinned Context\s*\n', re.MULTILINE)
+# Line that terminates the pinned section: next H1/H2 heading or a
+# plugin-managed boundary marker.
+_NEXT_SECTION_RE = re.compile(rf'(?:#{{1,2}}\s|<!-- (?:{_BOUNDARY_ALT}))')
+# Start of each "### " pinned entry.
+_ENTRY_RE = re.compile(r'^### ', re.MULTILINE)
+# Existing staleness marker, or "PR #NNN, merged YYYY-MM-DD" in entry text,
+# in one alternation so each entry is scanned once for both.
+_ENTRY_STATE_RE = re.compile(
+    r'(?P<stale><!-- STALE: Last relevant \d{4}-\d{2}-\d{2} -->)'
+    r'|PR\s*#\d+,?\s*merged\s+(?P<date>\d{4}-\d{2}-\d{2})'
+)
+# Fallback: any standalone YYYY-MM-DD date in the entry header line.
+_STANDALONE_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+
 
 # Staleness detection constants
 
@@ -92,16 +112,40 @@ def get_project_claude_md_path() -> Optional[Path]:
             return found
 
     # Fallback: detect git root (worktree-safe)
-    # Uses --git-common-dir instead of --show-toplevel because the latter
-    # returns the worktree path when run inside a worktree, which may not
-    # contain CLAUDE.md. --git-common-dir always points to the shared .git
-    # directory; its parent is the main repo root where CLAUDE.md lives.
-    # git returns this path relative to the invoking directory when run at a
-    # repo root (the bare ".git") and absolute elsewhere, so resolve a relative
-    # result against the cwd before taking its parent.
-    # NOTE: Twin pattern in skills/pact-memory/scripts/memory_api.py
-    #       (_detect_project_id) and working_memory.py (_get_claude_md_path)
-    #       -- keep in sync.
+    cwd = Path.cwd()
+    repo_root = _git_repo_root(str(cwd))
+    if repo_root is not None:
+        found = _find_existing_claude_md(repo_root)
+        if found is not None:
+            return found
+
+    # Last resort: current working directory
+    return _find_existing_claude_md(cwd)
+
+
+@functools.lru_cache(maxsize=4)
+def _git_repo_root(cwd: str) -> Optional[Path]:
+    """
+    Resolve the main repo root for `cwd` via `git rev-parse --git-common-dir`.
+
+    Memoized per cwd: SessionStart resolves the project CLAUDE.md several
+    times (staleness check, block signal, session-info update) and the git
+    fork+exec dwarfs the rest of each resolution. Keyed on the cwd string so
+    a chdir re-resolves. Returns None when git is unavailable or `cwd` is not
+    in a repository.
+
+    Uses --git-common-dir instead of --show-toplevel because the latter
+    returns the worktree path when run inside a worktree, which may not
+    contain CLAUDE.md. --git-common-dir always points to the shared .git
+    directory; its parent is the main repo root where CLAUDE.md lives.
+    git returns this path relative to the invoking directory when run at a
+    repo root (the bare ".git") and absolute elsewhere, so resolve a relative
+    result against the cwd before taking its parent.
+
+    NOTE: Twin pattern in skills/pact-memory/scripts/memory_api.py
+          (_detect_project_id) and working_memory.py (_get_claude_md_path)
+          -- keep in sync.
+    """
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--git-common-dir"],
@@ -109,19 +153,17 @@ def get_project_claude_md_path() -> Optional[Path]:
             text=True,
             timeout=5
         )
-        if result.returncode == 0 and result.stdout.strip():
-            common_dir = Path(result.stdout.strip())
-            if not common_dir.is_absolute():
-                common_dir = Path.cwd() / common_dir
-            repo_root = common_dir.resolve().parent
-            found = _find_existing_claude_md(repo_root)
-            if found is not None:
-                return found
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        pass
-
-    # Last resort: current working directory
-    return _find_existing_claude_md(Path.cwd())
+        return None
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+    common_dir = Path(result.stdout.strip())
+    if not common_dir.is_absolute():
+        common_dir = Path(cwd) / common_dir
+    try:
+        return common_dir.resolve().parent
+    except OSError:
+        return None
 
 
 # Backward-compatible alias (tests and session_init patch the underscore name)
@@ -220,7 +262,7 @@ def _parse_pinned_section(content: str) -> Optional[Tuple[int, int, str]]:
     else:
         scan_text, offset = content, 0
 
-    pinned_match = re.search(r'^## Pinned Context\s*\n', scan_text, re.MULTILINE)
+    pinned_match = _PINNED_HEADER_RE.search(scan_text)
     if not pinned_match:
         return None
 
@@ -230,11 +272,8 @@ def _parse_pinned_section(content: str) -> Optional[Tuple[int, int, str]]:
     # boundary marker — PACT_MEMORY_, PACT_MANAGED_, PACT_ROUTING_ — or end
     # of scan region). No fence-awareness needed — managed region contains
     # only plugin-generated content (round 10 structural guarantee).
-    next_section_pattern = re.compile(
-        rf'(?:#{{1,2}}\s|<!-- (?:{_BOUNDARY_ALT}))'
-    )
     pinned_end = _find_terminator_offset(
-        scan_text, pinned_start, next_section_pattern
+        scan_text, pinned_start, _NEXT_SECTION_RE
     )
 
     pinned_content = scan_text[pinned_start:pinned_end]
@@ -244,9 +283,26 @@ def _parse_pinned_section(content: str) -> Optional[Tuple[int, int, str]]:
     return pinned_start + offset, pinned_end + offset, pinned_content
 
 
-def detect_stale_entries(
-    pinned_content: str,
-) -> List[Tuple[int, str, str]]:
+def _index_entries(pinned_content: str) -> List[Tuple[int, int, int]]:
+    """
+    Index the `### ` entries of a pinned section in one pass.
+
+    Returns one `(start, heading_end, end)` triple per entry: `start`/`end`
+    bound the entry text and `heading_end` is the offset just past the
+    heading line's newline, or -1 for a single-line entry with none.
+    Detection and marking both work from these offsets instead of
+    re-deriving boundaries and newline positions per entry.
+    """
+    entry_starts = [m.start() for m in _ENTRY_RE.finditer(pinned_content)]
+    entries: List[Tuple[int, int, int]] = []
+    for i, start in enumerate(entry_starts):
+        end = entry_starts[i + 1] if i + 1 < len(entry_starts) else len(pinned_content)
+        nl_pos = pinned_content.find("\n", start, end)
+        entries.append((start, nl_pos + 1 if nl_pos != -1 else -1, end))
+    return entries
+
+
+def detect_stale_entries(pinned_content: str) -> List[Tuple[int, str, str]]:
     """
     Detect stale pinned context entries without modifying them.
 
@@ -260,52 +316,57 @@ def detect_stale_entries(
 
     Returns:
         List of (entry_index, date_string, entry_heading) tuples for each
-        stale entry found. entry_index is the position within entry_starts.
+        stale entry found. entry_index is the position within the entry index.
     """
-    entry_pattern = re.compile(r'^### ', re.MULTILINE)
-    entry_starts = [m.start() for m in entry_pattern.finditer(pinned_content)]
+    return _scan_entries(pinned_content, _index_entries(pinned_content))[0]
 
-    if not entry_starts:
-        return []
+
+def _scan_entries(
+    pinned_content: str,
+    entries: List[Tuple[int, int, int]],
+) -> Tuple[List[Tuple[int, str, str]], int]:
+    """
+    Single pass behind detect_stale_entries.
+
+    Returns:
+        (stale_entries, already_marked): stale_entries as documented on
+        detect_stale_entries, plus the number of entries that already carry
+        a STALE marker.
+    """
+    if not entries:
+        return [], 0
 
     now = datetime.now(timezone.utc)
     stale_threshold = now - timedelta(days=PINNED_STALENESS_DAYS)
 
-    # Pattern to match "PR #NNN, merged YYYY-MM-DD" in entry text
-    pr_merged_pattern = re.compile(
-        r'PR\s*#\d+,?\s*merged\s+(\d{4}-\d{2}-\d{2})'
-    )
-    # Fallback: any standalone YYYY-MM-DD date in the entry header line
-    standalone_date_pattern = re.compile(r'(\d{4}-\d{2}-\d{2})')
-    # Pattern to detect existing staleness marker
-    stale_marker_pattern = re.compile(r'<!-- STALE: Last relevant \d{4}-\d{2}-\d{2} -->')
+    # One sweep over all entries finds every STALE marker and merged-PR
+    # date; each hit is assigned to its owning entry by offset. Entries are
+    # contiguous and each begins with "### ", so no match spans two.
+    entry_starts = [start for start, _heading_end, _end in entries]
+    marked: Set[int] = set()
+    pr_dates: Dict[int, str] = {}
+    for match in _ENTRY_STATE_RE.finditer(pinned_content, entry_starts[0]):
+        i = bisect.bisect_right(entry_starts, match.start()) - 1
+        if match.group('stale'):
+            marked.add(i)
+        elif i not in pr_dates:
+            pr_dates[i] = match.group('date')
 
     stale_entries: List[Tuple[int, str, str]] = []
 
-    for i, start in enumerate(entry_starts):
-        if i + 1 < len(entry_starts):
-            end = entry_starts[i + 1]
-        else:
-            end = len(pinned_content)
-
-        entry_text = pinned_content[start:end]
-
-        # Skip entries already marked stale
-        if stale_marker_pattern.search(entry_text):
+    for i, (start, heading_end, end) in enumerate(entries):
+        # A marker anywhere in the entry means it is already handled.
+        if i in marked:
             continue
+        date_str = pr_dates.get(i)
 
         # Extract the heading line for context
-        nl_pos = entry_text.find("\n")
-        heading = entry_text[:nl_pos] if nl_pos != -1 else entry_text
-
-        # Look for PR merged date first (most specific)
-        date_str = None
-        pr_match = pr_merged_pattern.search(entry_text)
-        if pr_match:
-            date_str = pr_match.group(1)
-        else:
-            # Fallback: find any YYYY-MM-DD date in the heading line
-            date_match = standalone_date_pattern.search(heading)
+        heading = pinned_content[start:heading_end - 1 if heading_end != -1 else end]
+
+        # The merged-PR date is most specific; otherwise fall back to any
+        # YYYY-MM-DD date in the heading line
+        if not date_str:
+            date_match = _STANDALONE_DATE_RE.search(heading)
             if date_match:
                 date_str = date_match.group(1)
 
@@ -320,7 +381,7 @@ def detect_stale_entries(
         if entry_date < stale_threshold:
             stale_entries.append((i, date_str, heading))
 
-    return stale_entries
+    return stale_entries, len(marked)
 
 
 def apply_staleness_markings(
@@ -345,37 +406,29 @@ def apply_staleness_markings(
     Returns:
         Tuple of (new_full_content, stale_count, was_modified, budget_warning_str).
     """
-    entry_pattern = re.compile(r'^### ', re.MULTILINE)
-    entry_starts = [m.start() for m in entry_pattern.finditer(pinned_content)]
-    stale_marker_pattern = re.compile(r'<!-- STALE: Last relevant \d{4}-\d{2}-\d{2} -->')
-
-    # Count already-marked entries
-    already_stale = 0
-    for i, start in enumerate(entry_starts):
-        end = entry_starts[i + 1] if i + 1 < len(entry_starts) else len(pinned_content)
-        entry_text = pinned_content[start:end]
-        if stale_marker_pattern.search(entry_text):
-            already_stale += 1
+    entries = _index_entries(pinned_content)
 
-    # Detect new stale entries
-    stale_entries = detect_stale_entries(pinned_content)
+    # Detect new stale entries and count already-marked ones in one pass
+    stale_entries, already_stale = _scan_entries(pinned_content, entries)
     modified = False
 
-    # Apply stale markers in reverse order so string offsets remain valid
-    for idx, date_str, _heading in reversed(stale_entries):
-        start = entry_starts[idx]
-        end = entry_starts[idx + 1] if idx + 1 < len(entry_starts) else len(pinned_content)
-        entry_text = pinned_content[start:end]
-
-        stale_marker = f"<!-- STALE: Last relevant {date_str} -->\n"
-        nl_pos = entry_text.find("\n")
-        if nl_pos == -1:
-            # Entry is a single line with no newline; skip it
-            continue
-        heading_end = nl_pos + 1
-        new_entry = entry_text[:heading_end] + stale_marker + entry_text[heading_end:]
-        pinned_content = pinned_content[:start] + new_entry + pinned_content[end:]
-        modified = True
+    # Apply stale markers in one forward pass: each entry slice (with its
+    # marker inserted after the heading when stale) is collected and joined
+    # once, rather than re-splicing the whole section per stale entry.
+    if stale_entries:
+        stale_dates = {idx: date_str for idx, date_str, _heading in stale_entries}
+        parts: List[str] = [pinned_content[:entries[0][0]]]
+        for i, (start, heading_end, end) in enumerate(entries):
+            date_str = stale_dates.get(i)
+            if date_str is None or heading_end == -1:
+                # Not stale, or a single line with no newline; keep as-is
+                parts.append(pinned_content[start:end])
+                continue
+            parts.append(pinned_content[start:heading_end])
+            parts.append(f"<!-- STALE: Last relevant {date_str} -->\n")
+            parts.append(pinned_content[heading_end:end])
+            modified = True
+        pinned_content = "".join(parts)
 
     total_stale = already_stale + len(stale_entries)
 
@@ -389,16 +442,72 @@ def apply_staleness_markings(
             f"(budget: {PINNED_CONTEXT_TOKEN_BUDGET}). "
             f"Consider archiving stale pins. -->\n"
         )
-        # Add budget warning at the top of pinned section if not present
-        if "<!-- WARNING: Pinned context" not in pinned_content:
+        # Add budget warning at the top of pinned section if not present.
+        # It is only ever prepended, and _PINNED_HEADER_RE consumes the blank
+        # lines after the heading, so an existing warning sits at offset 0.
+        if not pinned_content.startswith("<!-- WARNING: Pinned context"):
             pinned_content = budget_warning_comment + pinned_content
             modified = True
         budget_warning = f", ~{pinned_tokens} tokens (budget: {PINNED_CONTEXT_TOKEN_BUDGET})"
 
-    new_content = content[:pinned_start] + pinned_content + content[pinned_end:]
+    if not modified:
+        # Nothing inserted: the splice would rebuild `content` verbatim.
+        return content, total_stale, modified, budget_warning
+    new_content = "".join((content[:pinned_start], pinned_content, content[pinned_end:]))
     return new_content, total_stale, modified, budget_warning
 
 
+def _staleness_cache_path(claude_md_path: Path) -> Path:
+    """Sidecar recording the last clean staleness pass for `claude_md_path`.
+
+    Named `{parent}/.{name}.staleness.json`, alongside the
+    `.{name}.lock` sidecar that file_lock keeps for the same target.
+    """
+    return claude_md_path.parent / f".{claude_md_path.name}.staleness.json"
+
+
+def _staleness_cache_key(st: os.stat_result) -> dict:
+    """Identity of a staleness pass: file (size, mtime_ns) plus the UTC date.
+
+    Entry dates are UTC midnights, so a verdict can only change when the
+    file changes or the UTC date rolls over.
+    """
+    return {
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "date": datetime.now(timezone.utc).date().isoformat(),
+    }
+
+
+def _read_staleness_cache(cache_path: Path, key: dict) -> Tuple[bool, Optional[str]]:
+    """Return (hit, message) for a sidecar matching `key`. Fail-open."""
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False, None
+    if not isinstance(cached, dict):
+        return False, None
+    if any(cached.get(k) != v for k, v in key.items()):
+        return False, None
+    message = cached.get("message")
+    if message is not None and not isinstance(message, str):
+        return False, None
+    return True, message
+
+
+def _write_staleness_cache(
+    cache_path: Path, key: dict, message: Optional[str]
+) -> Optional[str]:
+    """Record a clean pass's `message` under `key`; returns `message`. Fail-open."""
+    try:
+        cache_path.write_text(
+            json.dumps({**key, "message": message}), encoding="utf-8"
+        )
+    except OSError:
+        pass
+    return message
+
+
 def check_pinned_staleness(claude_md_path: Optional[Path] = None) -> Optional[str]:
     """
     Detect stale pinned context entries in the project CLAUDE.md.
@@ -414,8 +523,13 @@ def check_pinned_staleness(claude_md_path: Optional[Path] = None) -> Optional[st
     Also checks if the total pinned content exceeds the token budget and
     adds a warning comment if so (does NOT auto-delete pins).
 
-    This function orchestrates detection (detect_stale_entries) and
-    mutation (apply_staleness_markings) as separate steps for testability.
+    Detection and marking both happen in apply_staleness_markings, which
+    indexes the entries once and scans them with _scan_entries (the same
+    pass behind the read-only detect_stale_entries).
+
+    A pass that leaves the file untouched is recorded in a sidecar keyed on
+    the file's (size, mtime_ns) and the UTC date; while all three still
+    match, the recorded message is returned without reading the file.
 
     Args:
         claude_md_path: Explicit path to CLAUDE.md. If None, resolved via
@@ -431,6 +545,17 @@ def check_pinned_staleness(claude_md_path: Optional[Path] = None) -> Optional[st
     if claude_md_path is None:
         return None
 
+    # Stat BEFORE reading: a write landing in between leaves a stale key,
+    # which only costs the next session a full pass.
+    try:
+        cache_key = _staleness_cache_key(claude_md_path.stat())
+    except OSError:
+        return None
+    cache_path = _staleness_cache_path(claude_md_path)
+    hit, cached_message = _read_staleness_cache(cache_path, cache_key)
+    if hit:
+        return cached_message
+
     try:
         content = claude_md_path.read_text(encoding="utf-8")
     except (OSError, UnicodeDecodeError):
@@ -438,14 +563,12 @@ def check_pinned_staleness(claude_md_path: Optional[Path] = None) -> Optional[st
 
     parsed = _parse_pinned_section(content)
     if parsed is None:
-        return None
+        return _write_staleness_cache(cache_path, cache_key, None)
 
     pinned_start, pinned_end, pinned_content = parsed
 
-    entry_pattern = re.compile(r'^### ', re.MULTILINE)
-    entry_starts = [m.start() for m in entry_pattern.finditer(pinned_content)]
-    if not entry_starts:
-        return None
+    if not _ENTRY_RE.search(pinned_content):
+        return _write_staleness_cache(cache_path, cache_key, None)
 
     new_content, stale_count, modified, budget_warning = apply_staleness_markings(
         content, pinned_start, pinned_end, pinned_content
@@ -493,12 +616,17 @@ def check_pinned_staleness(claude_md_path: Optional[Path] = None) -> Optional[st
             logger_msg = f"Failed to update pinned staleness: {str(e)[:50]}"
             return logger_msg
 
+    message = None
     if stale_count > 0:
-        return f"Pinned context: {stale_count} stale pin(s) detected{budget_warning}"
-    if budget_warning:
-        return f"Pinned context{budget_warning}"
-
-    return None
+        message = f"Pinned context: {stale_count} stale pin(s) detected{budget_warning}"
+    elif budget_warning:
+        message = f"Pinned context{budget_warning}"
+
+    # Only an untouched file is recorded: after a write the stat no longer
+    # matches cache_key, and the next session's pass records the new state.
+    if not modified:
+        _write_staleness_cache(cache_path, cache_key, message)
+    return message
 
 
 def check_pinned_block_signal(
@@ -32,6 +32,7 @@ from .database import (
     delete_memory,
     list_memories,
     search_memories_by_text,
+    search_memory_ids_by_text,
 
     # Utilities
     generate_id,
@@ -39,6 +40,7 @@ from .database import (
     vacuum_database,
     check_integrity,
     quick_save,
+    bulk_quick_save,
 )
 
 # Graph layer
@@ -54,6 +56,7 @@ from .graph import (
     link_memory_to_files,
     link_memory_to_paths,
     get_files_for_memory,
+    get_file_paths_for_memories,
     get_memories_for_file,
     get_memories_for_files,
 
@@ -165,6 +168,7 @@ __all__ = [
     "delete_memory",
     "list_memories",
     "search_memories_by_text",
+    "search_memory_ids_by_text",
 
     # Database - Utilities
     "generate_id",
@@ -172,6 +176,7 @@ __all__ = [
     "vacuum_database",
     "check_integrity",
     "quick_save",
+    "bulk_quick_save",
 
     # Graph - File tracking
     "track_file",
@@ -184,6 +189,7 @@ __all__ = [
     "link_memory_to_files",
     "link_memory_to_paths",
     "get_files_for_memory",
+    "get_file_paths_for_memories",
     "get_memories_for_file",
     "get_memories_for_files",
 
@@ -13,10 +13,14 @@ Standard library sqlite3 has enable_load_extension disabled by default.
 Falls back gracefully to keyword-only search when extensions unavailable.
 """
 
+import atexit
+import functools
 import hashlib
 import json
 import logging
 import os
+import queue
+import secrets
 import unicodedata
 from contextlib import contextmanager
 from datetime import datetime, timezone
@@ -33,6 +37,21 @@ except ImportError:
     import sqlite3
     SQLITE_EXTENSIONS_ENABLED = False
 
+# orjson (optional) encodes and decodes several times faster than stdlib
+# json; fall back to stdlib when it is not installed. orjson's errors
+# subclass the stdlib ones (json.JSONDecodeError on load, TypeError on
+# dump), and OPT_NON_STR_KEYS keeps json.dumps' str() coercion of keys.
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 from .config import DB_PATH, PACT_MEMORY_DIR
 
 # Configure logging
@@ -102,6 +121,36 @@ def get_db_path() -> Path:
     return DB_PATH
 
 
+# Per-connection PRAGMAs applied by get_connection. synchronous=NORMAL is
+# corruption-safe under WAL (a power loss can drop only the last commits) and
+# skips the fsync on every commit; the rest keep temp tables in memory and
+# give reads a 20 MB page cache plus up to 256 MB of mmap.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys=ON;"
+    "PRAGMA busy_timeout=5000;"
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA cache_size=-20000;"
+    "PRAGMA mmap_size=268435456;"
+)
+
+# DB paths this process has already switched to WAL (journal_mode persists
+# in the file, so later opens of the same path skip the PRAGMA).
+_WAL_CONFIRMED_PATHS: Set[str] = set()
+
+
+class _PactConnection(sqlite3.Connection):
+    """sqlite3 connection that remembers whether ensure_initialized ran on it.
+
+    The base C type accepts no attributes, hence the subclass (installed via
+    ``sqlite3.connect(factory=...)`` in get_connection).
+    """
+
+    _pact_initialized = False
+    # Set once the FTS index is known to be usable (see _fts_usable).
+    _pact_fts = False
+
+
 def get_connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
     """
     Create and return a database connection.
@@ -129,13 +178,21 @@ def get_connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
         except OSError:
             pass  # Fall through to sqlite3.connect which will create it
 
-    conn = sqlite3.connect(str(path), check_same_thread=False)
+    conn = sqlite3.connect(
+        str(path), check_same_thread=False, factory=_PactConnection
+    )
     conn.row_factory = sqlite3.Row
 
-    # Enable WAL mode for corruption prevention and better concurrency
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys=ON")
-    conn.execute("PRAGMA busy_timeout=5000")
+    # Per-connection settings in one executescript round-trip. WAL mode for
+    # corruption prevention and better concurrency is persistent in the DB
+    # file, so it is only (re)asserted the first time this process opens
+    # a given path.
+    key = str(path)
+    if key in _WAL_CONFIRMED_PATHS:
+        conn.executescript(_CONNECTION_PRAGMAS)
+    else:
+        conn.executescript("PRAGMA journal_mode=WAL;" + _CONNECTION_PRAGMAS)
+        _WAL_CONFIRMED_PATHS.add(key)
 
     # Harden WAL sidecar files only on first creation (avoids redundant
     # syscall on every connection). WAL sidecars are created by the
@@ -163,17 +220,140 @@ def db_connection(db_path: Optional[Path] = None):
         with db_connection() as conn:
             cursor = conn.execute("SELECT * FROM memories")
     """
-    conn = get_connection(db_path)
+    if db_path is not None:
+        conn = get_connection(db_path)
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        return
+
+    # Default database: lease a pooled connection so repeated blocks in one
+    # process skip the connect + PRAGMA + ensure_initialized setup.
+    path = get_db_path()
+    conn = _lease_pooled_connection(path)
+    committed = False
     try:
         yield conn
         conn.commit()
+        committed = True
     except Exception:
         conn.rollback()
         raise
     finally:
+        if committed:
+            _release_pooled_connection(path, conn)
+        else:
+            conn.close()
+
+
+# Idle connections to the default database, as (path, connection) pairs so a
+# connection opened before DB_PATH changed is never handed out for the new path.
+_POOL: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+_POOL_MAX = 4
+
+
+def _lease_pooled_connection(path: Path) -> sqlite3.Connection:
+    """Take an idle pooled connection to ``path``, or open a new one."""
+    while True:
+        try:
+            pooled_path, conn = _POOL.get_nowait()
+        except queue.Empty:
+            return get_connection(path)
+        if pooled_path == path:
+            return conn
+        conn.close()
+
+
+def _release_pooled_connection(path: Path, conn: sqlite3.Connection) -> None:
+    """Return a committed connection to the pool, or close it if full."""
+    if _POOL.qsize() < _POOL_MAX:
+        _POOL.put((path, conn))
+    else:
         conn.close()
 
 
+def _drain_pool() -> None:
+    """Close every idle pooled connection (registered with atexit)."""
+    while True:
+        try:
+            _, conn = _POOL.get_nowait()
+        except queue.Empty:
+            return
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+atexit.register(_drain_pool)
+
+
+# Static schema DDL, run as one script by init_schema. BEGIN/COMMIT live
+# inside the script because executescript() commits any pending transaction
+# before it runs: every table and index lands in a single transaction (one
+# journal sync) instead of one implicit transaction per statement.
+_SCHEMA_DDL = """
+BEGIN;
+
+-- Core memory table (rich objects)
+CREATE TABLE IF NOT EXISTS memories (
+    id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
+    context TEXT,
+    goal TEXT,
+    active_tasks TEXT,
+    lessons_learned TEXT,
+    decisions TEXT,
+    entities TEXT,
+    reasoning_chains TEXT,
+    agreements_reached TEXT,
+    disagreements_resolved TEXT,
+    project_id TEXT,
+    session_id TEXT,
+    created_at TEXT DEFAULT (datetime('now')),
+    updated_at TEXT DEFAULT (datetime('now'))
+);
+
+-- Files table (for graph network)
+CREATE TABLE IF NOT EXISTS files (
+    id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
+    path TEXT NOT NULL,
+    project_id TEXT,
+    last_modified TEXT,
+    UNIQUE(path, project_id)
+);
+
+-- Memory to File relationships (graph edges)
+CREATE TABLE IF NOT EXISTS memory_files (
+    memory_id TEXT REFERENCES memories(id) ON DELETE CASCADE,
+    file_id TEXT REFERENCES files(id),
+    relationship TEXT DEFAULT 'modified',
+    PRIMARY KEY (memory_id, file_id)
+);
+
+-- File to File relationships (imports, tests, etc.)
+CREATE TABLE IF NOT EXISTS file_relations (
+    source_file TEXT REFERENCES files(id),
+    target_file TEXT REFERENCES files(id),
+    relationship TEXT,
+    PRIMARY KEY (source_file, target_file, relationship)
+);
+
+-- Indexes for efficient queries
+CREATE INDEX IF NOT EXISTS idx_memories_project ON memories(project_id);
+CREATE INDEX IF NOT EXISTS idx_memories_session ON memories(session_id);
+CREATE INDEX IF NOT EXISTS idx_memories_created ON memories(created_at);
+CREATE INDEX IF NOT EXISTS idx_files_project ON files(project_id);
+CREATE INDEX IF NOT EXISTS idx_memory_files_file ON memory_files(file_id);
+
+COMMIT;
+"""
+
+
 def init_schema(conn: sqlite3.Connection) -> None:
     """
     Initialize the database schema.
@@ -184,65 +364,14 @@ def init_schema(conn: sqlite3.Connection) -> None:
     Args:
         conn: Active database connection.
     """
-    # Core memory table (rich objects)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS memories (
-            id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
-            context TEXT,
-            goal TEXT,
-            active_tasks TEXT,
-            lessons_learned TEXT,
-            decisions TEXT,
-            entities TEXT,
-            reasoning_chains TEXT,
-            agreements_reached TEXT,
-            disagreements_resolved TEXT,
-            project_id TEXT,
-            session_id TEXT,
-            created_at TEXT DEFAULT (datetime('now')),
-            updated_at TEXT DEFAULT (datetime('now'))
-        )
-    """)
-
-    # Files table (for graph network)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS files (
-            id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
-            path TEXT NOT NULL,
-            project_id TEXT,
-            last_modified TEXT,
-            UNIQUE(path, project_id)
-        )
-    """)
-
-    # Memory to File relationships (graph edges)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS memory_files (
-            memory_id TEXT REFERENCES memories(id) ON DELETE CASCADE,
-            file_id TEXT REFERENCES files(id),
-            relationship TEXT DEFAULT 'modified',
-            PRIMARY KEY (memory_id, file_id)
-        )
-    """)
-
-    # File to File relationships (imports, tests, etc.)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS file_relations (
-            source_file TEXT REFERENCES files(id),
-            target_file TEXT REFERENCES files(id),
-            relationship TEXT,
-            PRIMARY KEY (source_file, target_file, relationship)
-        )
-    """)
+    # Tables and indexes: one script, one transaction (see _SCHEMA_DDL)
+    conn.executescript(_SCHEMA_DDL)
 
-    # Create indexes for efficient queries
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_memories_project ON memories(project_id)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_memories_session ON memories(session_id)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_memories_created ON memories(created_at)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_files_project ON files(project_id)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_memory_files_file ON memory_files(file_id)")
+    # Full-text index backing search_memories_by_text (optional)
+    _init_fts_table(conn)
 
-    # Attempt to create vector table for semantic search
+    # Attempt to create vector table for semantic search (dynamic dimension,
+    # so kept out of the static script)
     _init_vector_table(conn)
 
     conn.commit()
@@ -258,7 +387,9 @@ def _init_vector_table(conn: sqlite3.Connection) -> bool:
     2. sqlite-vec extension (for vector storage)
 
     Standard library sqlite3 has enable_load_extension disabled by default,
-    so we check SQLITE_EXTENSIONS_ENABLED before attempting.
+    so we check SQLITE_EXTENSIONS_ENABLED before attempting. Setting
+    PACT_DISABLE_VEC=1 skips the vector table entirely (for callers that
+    never run semantic search).
 
     Note: The embedding dimension depends on the active backend:
     - model2vec: 256 dimensions
@@ -273,6 +404,10 @@ def _init_vector_table(conn: sqlite3.Connection) -> bool:
     Returns:
         True if vector table was created, False otherwise.
     """
+    if os.environ.get("PACT_DISABLE_VEC") == "1":
+        logger.info("Vector storage disabled via PACT_DISABLE_VEC=1.")
+        return False
+
     # Check if extension loading is possible
     if not SQLITE_EXTENSIONS_ENABLED:
         logger.info(
@@ -295,10 +430,7 @@ def _init_vector_table(conn: sqlite3.Connection) -> bool:
             )
             return False
 
-        # Get the embedding dimension from the embedding service
-        # Import here to avoid circular imports
-        from .embeddings import get_embedding_service
-        embedding_dim = get_embedding_service().embedding_dimension
+        embedding_dim = _resolve_embedding_dim()
 
         # Check if table exists with different dimension and needs recreation
         _check_and_migrate_vector_table(conn, embedding_dim)
@@ -319,6 +451,18 @@ def _init_vector_table(conn: sqlite3.Connection) -> bool:
         return False
 
 
+def _resolve_embedding_dim() -> int:
+    """
+    Return the active embedding backend's dimension.
+
+    The embeddings import (and backend/model load) is deferred to here so it
+    only happens once sqlite-vec has actually loaded; it also avoids a
+    circular import.
+    """
+    from .embeddings import get_embedding_service
+    return get_embedding_service().embedding_dimension
+
+
 def _check_and_migrate_vector_table(conn: sqlite3.Connection, new_dim: int) -> None:
     """
     Check if vec_memories table exists with different dimension and handle migration.
@@ -343,8 +487,8 @@ def _check_and_migrate_vector_table(conn: sqlite3.Connection, new_dim: int) -> N
         # This gives a binary match/mismatch answer (not the actual old dimension).
         # Note: memory_init.py uses byte-length (len(blob)//4) instead because it needs
         # the actual old dimension value for diagnostic messages during re-embedding.
-        import struct
-        test_embedding = struct.pack(f'{new_dim}f', *([0.0] * new_dim))
+        # All-zero bytes are exactly new_dim float32 zeros.
+        test_embedding = bytes(new_dim * 4)
 
         try:
             # Try a test query that would fail if dimensions don't match
@@ -388,6 +532,159 @@ def _migrate_ct_fields(conn: sqlite3.Connection) -> None:
     conn.commit()
 
 
+# Columns search_memories_by_text matches against, in FTS column order.
+_TEXT_SEARCH_COLUMNS = (
+    "context", "goal", "lessons_learned", "decisions",
+    "reasoning_chains", "agreements_reached", "disagreements_resolved",
+)
+
+
+_TEXT_SEARCH_COLUMN_SET = frozenset(_TEXT_SEARCH_COLUMNS)
+_FTS_COLUMNS_SQL = ", ".join(_TEXT_SEARCH_COLUMNS)
+
+# The index is kept in step from Python, inside each write's transaction,
+# rather than by triggers: a trigger on `memories` would make every
+# INSERT/UPDATE/DELETE fail ("no such module"/"no such tokenizer") on a
+# SQLite build without FTS5 trigram that opens the same database. Such
+# connections write normally and flag the index stale (_flag_fts_stale);
+# the next FTS-capable connection rebuilds it before use (_refresh_stale_fts).
+_FTS_INDEX_SQL = (
+    f"INSERT INTO memories_fts(rowid, {_FTS_COLUMNS_SQL}) "
+    f"SELECT rowid, {_FTS_COLUMNS_SQL} FROM memories WHERE id = ?"
+)
+_FTS_UNINDEX_SQL = (
+    f"INSERT INTO memories_fts(memories_fts, rowid, {_FTS_COLUMNS_SQL}) "
+    f"SELECT 'delete', rowid, {_FTS_COLUMNS_SQL} FROM memories WHERE id = ?"
+)
+
+# Plain (non-virtual) marker table, so any SQLite build can write it. A row
+# means memories changed without the index being updated.
+_FTS_SUPPORT_DDL = """
+    CREATE TABLE IF NOT EXISTS memories_search_stale (
+        flag INTEGER PRIMARY KEY CHECK (flag = 1)
+    );
+    DROP TRIGGER IF EXISTS memories_fts_ai;
+    DROP TRIGGER IF EXISTS memories_fts_ad;
+    DROP TRIGGER IF EXISTS memories_fts_au;
+"""
+
+
+def _fts_create_ddl() -> str:
+    """DDL for the external-content FTS5 index over _TEXT_SEARCH_COLUMNS.
+
+    The trigram tokenizer keeps search_memories_by_text's case-insensitive
+    substring semantics (a MATCH on a quoted phrase finds it anywhere in a
+    column, like LIKE '%term%') while answering from the index. It is keyed
+    on the memories rowid and maintained by the write helpers.
+    """
+    return f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+            {_FTS_COLUMNS_SQL},
+            content='memories', content_rowid='rowid', tokenize='trigram'
+        );
+    """
+
+
+def _init_fts_table(conn: sqlite3.Connection) -> bool:
+    """
+    Create (or adopt) the FTS5 index used by search_memories_by_text.
+
+    On a database that predates the index, the existing rows are indexed
+    with an FTS 'rebuild'. Fails soft: if this SQLite build lacks FTS5 or
+    the trigram tokenizer (SQLite < 3.34), search keeps its LIKE scan and
+    writes flag the index stale for FTS-capable connections to rebuild.
+    Triggers left by an earlier schema are dropped here, on any build.
+
+    Args:
+        conn: Active database connection.
+
+    Returns:
+        True if the FTS index is available, False otherwise.
+    """
+    try:
+        cursor = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='memories_fts'"
+        )
+        if cursor.fetchone() is not None:
+            conn.executescript(_FTS_SUPPORT_DDL)
+            return _fts_usable(conn)
+        conn.executescript(
+            "BEGIN;" + _fts_create_ddl() + _FTS_SUPPORT_DDL
+            + "INSERT INTO memories_fts(memories_fts) VALUES ('rebuild');"
+            + "COMMIT;"
+        )
+        return True
+    except sqlite3.Error as e:
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            pass
+        logger.info(f"Full-text index unavailable ({e}); text search will use LIKE scans.")
+        return False
+
+
+def _fts_usable(conn: sqlite3.Connection) -> bool:
+    """True if this connection can read and write the FTS index.
+
+    Preparing a statement on memories_fts fails when the table is missing
+    or this build lacks the fts5 module or trigram tokenizer. The marker
+    table is required too: _init_fts_table creates it in the same script
+    that drops legacy triggers, so Python-side sync never doubles up with
+    them. A positive answer is remembered on get_connection connections; a
+    negative one is not, since another process may create the index later.
+    """
+    if isinstance(conn, _PactConnection) and conn._pact_fts:
+        return True
+    try:
+        conn.execute(
+            "SELECT memories_fts.rowid FROM memories_fts, memories_search_stale WHERE 0"
+        )
+    except sqlite3.Error:
+        return False
+    if isinstance(conn, _PactConnection):
+        conn._pact_fts = True
+    return True
+
+
+def _refresh_stale_fts(conn: sqlite3.Connection) -> bool:
+    """Rebuild the FTS index if a non-FTS writer flagged it stale.
+
+    Runs in the caller's transaction; the caller commits. Returns True if
+    a rebuild happened.
+    """
+    if conn.execute("SELECT 1 FROM memories_search_stale").fetchone() is None:
+        return False
+    conn.execute("INSERT INTO memories_fts(memories_fts) VALUES ('rebuild')")
+    conn.execute("DELETE FROM memories_search_stale")
+    return True
+
+
+def _fts_prepare_write(conn: sqlite3.Connection) -> bool:
+    """
+    Called before a write to `memories`. Returns True if the caller must
+    index/unindex the rows it writes (after bringing a stale index up to
+    date); False if the index is not usable on this connection, in which
+    case the caller calls _flag_fts_stale after writing.
+    """
+    if not _fts_usable(conn):
+        return False
+    _refresh_stale_fts(conn)
+    return True
+
+
+def _flag_fts_stale(conn: sqlite3.Connection) -> None:
+    """Mark the FTS index stale after an unindexed write, if it exists.
+
+    Called after the write statement, so the schema check runs inside the
+    write transaction and cannot miss an index created concurrently.
+    """
+    cursor = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='memories_search_stale'"
+    )
+    if cursor.fetchone() is not None:
+        conn.execute("INSERT OR IGNORE INTO memories_search_stale (flag) VALUES (1)")
+
+
 def ensure_initialized(conn: sqlite3.Connection) -> None:
     """
     Ensure the database is initialized.
@@ -395,9 +692,17 @@ def ensure_initialized(conn: sqlite3.Connection) -> None:
     Checks if tables exist and initializes schema if not.
     For existing databases, runs migrations to add any new columns.
 
+    Runs once per connection from get_connection: every CRUD helper calls
+    this, and repeating the catalog lookup + migrations on each call is
+    wasted work. Connections from elsewhere (no ``_pact_initialized`` slot)
+    are checked on every call, as before.
+
     Args:
         conn: Active database connection.
     """
+    if isinstance(conn, _PactConnection) and conn._pact_initialized:
+        return
+
     cursor = conn.execute(
         "SELECT name FROM sqlite_master WHERE type='table' AND name='memories'"
     )
@@ -405,8 +710,12 @@ def ensure_initialized(conn: sqlite3.Connection) -> None:
         init_schema(conn)
     else:
         _migrate_ct_fields(conn)
+        _init_fts_table(conn)
         _init_vector_table(conn)
 
+    if isinstance(conn, _PactConnection):
+        conn._pact_initialized = True
+
 
 # =============================================================================
 # Column allow-list (issue #374 — bug 2 fix)
@@ -721,8 +1030,8 @@ def _normalize_list_field(field: str, value: Any) -> List[Any]:
 # JSON Field Helpers
 # =============================================================================
 
-JSON_FIELDS = {"active_tasks", "lessons_learned", "decisions", "entities",
-               "reasoning_chains", "agreements_reached", "disagreements_resolved"}
+JSON_FIELDS = frozenset({"active_tasks", "lessons_learned", "decisions", "entities",
+                         "reasoning_chains", "agreements_reached", "disagreements_resolved"})
 
 
 def _serialize_json_fields(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -739,7 +1048,7 @@ def _serialize_json_fields(data: Dict[str, Any]) -> Dict[str, Any]:
     for field in JSON_FIELDS:
         if field in result and result[field] is not None:
             if isinstance(result[field], (list, dict)):
-                result[field] = json.dumps(result[field])
+                result[field] = _json_dumps(result[field])
     return result
 
 
@@ -762,7 +1071,7 @@ def _deserialize_json_fields(row: Union[sqlite3.Row, Dict[str, Any]]) -> Dict[st
         if field in result and result[field] is not None:
             if isinstance(result[field], str):
                 try:
-                    result[field] = json.loads(result[field])
+                    result[field] = _json_loads(result[field])
                 except json.JSONDecodeError:
                     # Keep as string if not valid JSON
                     pass
@@ -775,37 +1084,31 @@ def _deserialize_json_fields(row: Union[sqlite3.Row, Dict[str, Any]]) -> Dict[st
 
 def generate_id() -> str:
     """Generate a unique ID for a new memory."""
-    import secrets
     return secrets.token_hex(16)
 
 
-def create_memory(
-    conn: sqlite3.Connection,
-    memory: Dict[str, Any]
-) -> str:
-    """
-    Create a new memory record.
+# Column order of _INSERT_MEMORY_SQL. The statement text is a module
+# constant so every create hands sqlite3 the identical SQL string and hits
+# its per-connection statement cache instead of re-preparing.
+_INSERT_MEMORY_COLUMNS = (
+    "id", "context", "goal", "active_tasks", "lessons_learned",
+    "decisions", "entities", "reasoning_chains", "agreements_reached",
+    "disagreements_resolved", "project_id", "session_id",
+    "created_at", "updated_at",
+)
+_INSERT_MEMORY_SQL = (
+    f"INSERT INTO memories ({', '.join(_INSERT_MEMORY_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_INSERT_MEMORY_COLUMNS))})"
+)
 
-    Args:
-        conn: Active database connection.
-        memory: Memory dictionary with fields:
-            - context: Optional[str] - Working context
-            - goal: Optional[str] - Goal description
-            - active_tasks: Optional[List[dict]] - Task list
-            - lessons_learned: Optional[List[str]] - Lessons
-            - decisions: Optional[List[dict]] - Decisions
-            - entities: Optional[List[dict]] - Entities
-            - reasoning_chains: Optional[List[str]] - How key decisions connect
-            - agreements_reached: Optional[List[str]] - What was verified via teachback
-            - disagreements_resolved: Optional[List[str]] - Where agents disagreed and resolution
-            - project_id: Optional[str] - Project identifier
-            - session_id: Optional[str] - Session identifier
 
-    Returns:
-        The ID of the created memory.
+def _prepare_memory_row(memory: Dict[str, Any], now: str) -> tuple:
     """
-    ensure_initialized(conn)
+    Validate, canonicalize and serialize one create payload.
 
+    Raises before anything is written (see create_memory). Returns the
+    parameter tuple for _INSERT_MEMORY_SQL; its first element is the ID.
+    """
     # Generate ID if not provided
     memory_id = memory.get("id") or generate_id()
 
@@ -845,39 +1148,96 @@ def create_memory(
 
     # Prepare data with JSON serialization
     data = _serialize_json_fields(normalized)
+    data["id"] = memory_id
+    data["created_at"] = now
+    data["updated_at"] = now
+    return tuple(data.get(col) for col in _INSERT_MEMORY_COLUMNS)
 
-    # Set timestamps
-    now = datetime.now(timezone.utc).isoformat()
 
-    conn.execute("""
-        INSERT INTO memories (
-            id, context, goal, active_tasks, lessons_learned,
-            decisions, entities, reasoning_chains, agreements_reached,
-            disagreements_resolved, project_id, session_id,
-            created_at, updated_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        memory_id,
-        data.get("context"),
-        data.get("goal"),
-        data.get("active_tasks"),
-        data.get("lessons_learned"),
-        data.get("decisions"),
-        data.get("entities"),
-        data.get("reasoning_chains"),
-        data.get("agreements_reached"),
-        data.get("disagreements_resolved"),
-        data.get("project_id"),
-        data.get("session_id"),
-        now,
-        now
-    ))
+def create_memory(
+    conn: sqlite3.Connection,
+    memory: Dict[str, Any]
+) -> str:
+    """
+    Create a new memory record.
+
+    Args:
+        conn: Active database connection.
+        memory: Memory dictionary with fields:
+            - context: Optional[str] - Working context
+            - goal: Optional[str] - Goal description
+            - active_tasks: Optional[List[dict]] - Task list
+            - lessons_learned: Optional[List[str]] - Lessons
+            - decisions: Optional[List[dict]] - Decisions
+            - entities: Optional[List[dict]] - Entities
+            - reasoning_chains: Optional[List[str]] - How key decisions connect
+            - agreements_reached: Optional[List[str]] - What was verified via teachback
+            - disagreements_resolved: Optional[List[str]] - Where agents disagreed and resolution
+            - project_id: Optional[str] - Project identifier
+            - session_id: Optional[str] - Session identifier
+
+    Returns:
+        The ID of the created memory.
+    """
+    ensure_initialized(conn)
+
+    row = _prepare_memory_row(memory, datetime.now(timezone.utc).isoformat())
+    index_fts = _fts_prepare_write(conn)
+    conn.execute(_INSERT_MEMORY_SQL, row)
+    if index_fts:
+        conn.execute(_FTS_INDEX_SQL, (row[0],))
+    else:
+        _flag_fts_stale(conn)
 
     conn.commit()
+    memory_id = row[0]
     logger.debug(f"Created memory with ID: {memory_id}")
     return memory_id
 
 
+def create_memories(
+    conn: sqlite3.Connection,
+    memories: List[Dict[str, Any]]
+) -> List[str]:
+    """
+    Create several memory records in one transaction.
+
+    Every payload is validated exactly as in create_memory BEFORE any row is
+    written, so one bad payload leaves the database untouched. The rows are
+    then inserted with a single executemany and one commit.
+
+    Args:
+        conn: Active database connection.
+        memories: Memory dictionaries (same fields as create_memory).
+
+    Returns:
+        The IDs of the created memories, in input order.
+    """
+    ensure_initialized(conn)
+
+    now = datetime.now(timezone.utc).isoformat()
+    rows = [_prepare_memory_row(memory, now) for memory in memories]
+    if not rows:
+        return []
+    try:
+        index_fts = _fts_prepare_write(conn)
+        conn.executemany(_INSERT_MEMORY_SQL, rows)
+        if index_fts:
+            conn.executemany(_FTS_INDEX_SQL, [(row[0],) for row in rows])
+        else:
+            _flag_fts_stale(conn)
+        conn.commit()
+    except Exception:
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            pass
+        raise
+
+    logger.debug("Created %d memories", len(rows))
+    return [row[0] for row in rows]
+
+
 def resolve_memory_id_prefix(
     conn: sqlite3.Connection,
     prefix: str,
@@ -1007,6 +1367,51 @@ def get_memory(
     return _deserialize_json_fields(row)
 
 
+@functools.lru_cache(maxsize=64)
+def _update_sql_for(cols: tuple) -> str:
+    """UPDATE statement setting `cols` (sorted) for one memory ID.
+
+    Cached so a given column set always yields the identical SQL string,
+    which sqlite3's statement cache then serves without re-preparing.
+    Column names are allow-listed (_reject_unknown_columns) before reaching
+    here.
+    """
+    set_clauses = ", ".join(f"{col} = ?" for col in cols)
+    return f"UPDATE memories SET {set_clauses} WHERE id = ?"
+
+
+def _update_statement(data: Dict[str, Any], memory_id: str) -> tuple:
+    """(sql, params) for writing serialized `data` to memory `memory_id`."""
+    cols = tuple(sorted(data))
+    return _update_sql_for(cols), [data[col] for col in cols] + [memory_id]
+
+
+def _execute_update(
+    conn: sqlite3.Connection, data: Dict[str, Any], memory_id: str
+) -> sqlite3.Cursor:
+    """Write serialized `data` to memory `memory_id`, keeping FTS in step.
+
+    The index is only touched when a searchable column changes.
+    """
+    if _TEXT_SEARCH_COLUMN_SET.isdisjoint(data):
+        return conn.execute(*_update_statement(data, memory_id))
+    index_fts = _fts_prepare_write(conn)
+    if index_fts:
+        conn.execute(_FTS_UNINDEX_SQL, (memory_id,))
+    cursor = conn.execute(*_update_statement(data, memory_id))
+    if index_fts:
+        conn.execute(_FTS_INDEX_SQL, (memory_id,))
+    else:
+        _flag_fts_stale(conn)
+    return cursor
+
+
+def _memory_exists(conn: sqlite3.Connection, memory_id: str) -> bool:
+    """True if a memory with exactly `memory_id` exists (no row decode)."""
+    cursor = conn.execute("SELECT 1 FROM memories WHERE id = ?", (memory_id,))
+    return cursor.fetchone() is not None
+
+
 def update_memory(
     conn: sqlite3.Connection,
     memory_id: str,
@@ -1039,9 +1444,9 @@ def update_memory(
     """
     ensure_initialized(conn)
 
-    # Check if memory exists
-    if get_memory(conn, memory_id) is None:
-        return False
+    # No up-front existence probe (it was a SELECT * plus JSON decode of every
+    # field, thrown away): the UPDATE's rowcount reports a missing ID, and the
+    # paths that never reach an UPDATE check existence themselves.
 
     # Strip server-owned fields (id, created_at, updated_at) BEFORE validation
     # so callers can pass a full memory dict through without tripping
@@ -1085,9 +1490,9 @@ def update_memory(
 
     # Nothing to write (e.g. payload contained only id/created_at, which were
     # stripped above). Return True without bumping updated_at — an id-only
-    # call should be a no-op, not a touch.
+    # call should be a no-op, not a touch — provided the memory exists.
     if not normalized:
-        return True
+        return _memory_exists(conn, memory_id)
 
     # If we have list fields to merge additively, we need a SELECT + UPDATE
     # transaction under BEGIN IMMEDIATE. Default sqlite3 isolation is
@@ -1112,7 +1517,10 @@ def update_memory(
                 (memory_id,),
             )
             row = cursor.fetchone()
-            current = _deserialize_json_fields(dict(row)) if row else {}
+            if row is None:
+                conn.commit()  # release BEGIN IMMEDIATE write lock
+                return False
+            current = _deserialize_json_fields(dict(row))
             # Track which merged list fields actually produced a different
             # result from the existing list. If every incoming item was a
             # duplicate, merged == existing and there's nothing to write.
@@ -1123,7 +1531,7 @@ def update_memory(
                     # Defensive: a legacy row where JSON deserialization
                     # didn't resolve (e.g. stored as a plain string).
                     try:
-                        existing = json.loads(existing)
+                        existing = _json_loads(existing)
                     except (json.JSONDecodeError, TypeError):
                         existing = []
                 if not isinstance(existing, list):
@@ -1155,24 +1563,14 @@ def update_memory(
             # Serialize and write inside the same transaction.
             data = _serialize_json_fields(normalized)
             data["updated_at"] = datetime.now(timezone.utc).isoformat()
-            set_clauses = [f"{k} = ?" for k in data.keys()]
-            values = list(data.values()) + [memory_id]
-            conn.execute(
-                f"UPDATE memories SET {', '.join(set_clauses)} WHERE id = ?",
-                values,
-            )
+            cursor = _execute_update(conn, data, memory_id)
             conn.commit()
         else:
             # Replace-only or no list fields: no merge-read hazard, so a
             # plain commit is fine.
             data = _serialize_json_fields(normalized)
             data["updated_at"] = datetime.now(timezone.utc).isoformat()
-            set_clauses = [f"{k} = ?" for k in data.keys()]
-            values = list(data.values()) + [memory_id]
-            conn.execute(
-                f"UPDATE memories SET {', '.join(set_clauses)} WHERE id = ?",
-                values,
-            )
+            cursor = _execute_update(conn, data, memory_id)
             conn.commit()
     except Exception:
         # Safety net: roll back any open transaction (additive merge or
@@ -1183,6 +1581,8 @@ def update_memory(
             pass
         raise
 
+    if cursor.rowcount == 0:
+        return False
     logger.debug("Updated memory %s (replace=%s)", memory_id, replace)
     return True
 
@@ -1205,10 +1605,15 @@ def delete_memory(
     """
     ensure_initialized(conn)
 
+    index_fts = _fts_prepare_write(conn)
+    if index_fts:
+        conn.execute(_FTS_UNINDEX_SQL, (memory_id,))
     cursor = conn.execute(
         "DELETE FROM memories WHERE id = ?",
         (memory_id,)
     )
+    if not index_fts:
+        _flag_fts_stale(conn)
     conn.commit()
 
     deleted = cursor.rowcount > 0
@@ -1217,6 +1622,27 @@ def delete_memory(
     return deleted
 
 
+def _list_memories_sql(by_project: bool, by_session: bool) -> str:
+    conditions = []
+    if by_project:
+        conditions.append("project_id = ?")
+    if by_session:
+        conditions.append("session_id = ?")
+    where = " WHERE " + " AND ".join(conditions) if conditions else ""
+    return f"SELECT * FROM memories{where} ORDER BY created_at DESC LIMIT ? OFFSET ?"
+
+
+# list_memories statement per (project filter, session filter) combination,
+# built once. Each variant keeps an equality predicate the planner can answer
+# from idx_memories_project / idx_memories_session; a single
+# "(? IS NULL OR project_id = ?)" form would force a full scan instead.
+_LIST_MEMORIES_SQL = {
+    (by_project, by_session): _list_memories_sql(by_project, by_session)
+    for by_project in (False, True)
+    for by_session in (False, True)
+}
+
+
 def list_memories(
     conn: sqlite3.Connection,
     project_id: Optional[str] = None,
@@ -1239,23 +1665,11 @@ def list_memories(
     """
     ensure_initialized(conn)
 
-    query = "SELECT * FROM memories"
-    params: List[Any] = []
-    conditions = []
-
-    if project_id is not None:
-        conditions.append("project_id = ?")
-        params.append(project_id)
-
-    if session_id is not None:
-        conditions.append("session_id = ?")
-        params.append(session_id)
-
-    if conditions:
-        query += " WHERE " + " AND ".join(conditions)
-
-    query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+    params: List[Any] = [
+        value for value in (project_id, session_id) if value is not None
+    ]
     params.extend([limit, offset])
+    query = _LIST_MEMORIES_SQL[(project_id is not None, session_id is not None)]
 
     cursor = conn.execute(query, params)
     rows = cursor.fetchall()
@@ -1270,11 +1684,14 @@ def search_memories_by_text(
     limit: int = 10
 ) -> List[Dict[str, Any]]:
     """
-    Search memories by text content (basic substring search).
+    Search memories by text content (case-insensitive substring search).
 
     Searches across context, goal, lessons_learned, decisions,
     reasoning_chains, agreements_reached, and disagreements_resolved fields.
-    For semantic search, use the search module with embeddings.
+    Terms of three or more characters are answered from the trigram FTS5
+    index (see _init_fts_table); shorter terms, and databases without the
+    index, use a LIKE scan. For semantic search, use the search module with
+    embeddings.
 
     Args:
         conn: Active database connection.
@@ -1285,38 +1702,67 @@ def search_memories_by_text(
     Returns:
         List of matching memory dictionaries.
     """
-    ensure_initialized(conn)
+    rows = _text_search_rows(conn, "*", search_term, project_id, limit)
+    return [_deserialize_json_fields(row) for row in rows]
 
-    # Escape SQL LIKE wildcards in the search term so literal % and _ are matched.
-    # NOTE: ESCAPE '\\' is SQLite-specific syntax; update if migrating to another DB dialect.
-    escaped = search_term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-    search_pattern = f"%{escaped}%"
 
-    query = """
-        SELECT * FROM memories
-        WHERE (
-            context LIKE ? ESCAPE '\\'
-            OR goal LIKE ? ESCAPE '\\'
-            OR lessons_learned LIKE ? ESCAPE '\\'
-            OR decisions LIKE ? ESCAPE '\\'
-            OR reasoning_chains LIKE ? ESCAPE '\\'
-            OR agreements_reached LIKE ? ESCAPE '\\'
-            OR disagreements_resolved LIKE ? ESCAPE '\\'
-        )
+def search_memory_ids_by_text(
+    conn: sqlite3.Connection,
+    search_term: str,
+    project_id: Optional[str] = None,
+    limit: int = 10
+) -> List[str]:
     """
-    params = [search_pattern] * 7
+    Return the IDs of memories matching search_term, newest first.
 
+    Same matching and ordering as search_memories_by_text, but selects only
+    the id column, so no full rows are read or JSON fields deserialized.
+    """
+    rows = _text_search_rows(conn, "id", search_term, project_id, limit)
+    return [row[0] for row in rows]
+
+
+def _text_search_rows(
+    conn: sqlite3.Connection,
+    select: str,
+    search_term: str,
+    project_id: Optional[str],
+    limit: int,
+) -> List[sqlite3.Row]:
+    """Run the text search behind search_memories_by_text, selecting `select`."""
+    ensure_initialized(conn)
+
+    filters = ""
+    filter_params: List[Any] = []
     if project_id is not None:
-        query += " AND project_id = ?"
-        params.append(project_id)
+        filters = " AND project_id = ?"
+        filter_params.append(project_id)
+    tail = filters + " ORDER BY created_at DESC LIMIT ?"
+    filter_params.append(limit)
+
+    # Indexed path: trigram FTS needs at least three characters to match.
+    # A quoted FTS phrase matches the term as a literal substring; embedded
+    # double quotes are escaped by doubling.
+    if len(search_term) >= 3 and _fts_usable(conn):
+        if _refresh_stale_fts(conn):
+            conn.commit()
+        phrase = '"' + search_term.replace('"', '""') + '"'
+        return conn.execute(
+            f"SELECT {select} FROM memories WHERE rowid IN "
+            "(SELECT rowid FROM memories_fts WHERE memories_fts MATCH ?)" + tail,
+            [phrase] + filter_params,
+        ).fetchall()
 
-    query += " ORDER BY created_at DESC LIMIT ?"
-    params.append(limit)
+    # Escape SQL LIKE wildcards in the search term so literal % and _ are matched.
+    # NOTE: ESCAPE '\\' is SQLite-specific syntax; update if migrating to another DB dialect.
+    escaped = search_term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    search_pattern = f"%{escaped}%"
 
-    cursor = conn.execute(query, params)
-    rows = cursor.fetchall()
+    where = " OR ".join(f"{col} LIKE ? ESCAPE '\\'" for col in _TEXT_SEARCH_COLUMNS)
+    query = f"SELECT {select} FROM memories WHERE ({where})" + tail
+    params = [search_pattern] * len(_TEXT_SEARCH_COLUMNS) + filter_params
 
-    return [_deserialize_json_fields(row) for row in rows]
+    return conn.execute(query, params).fetchall()
 
 
 # =============================================================================
@@ -1360,6 +1806,12 @@ def vacuum_database(conn: sqlite3.Connection) -> None:
         conn: Active database connection.
     """
     conn.execute("VACUUM")
+    # VACUUM may renumber the rowids of `memories` (it has no INTEGER PRIMARY
+    # KEY), and the external-content FTS index is keyed on them.
+    if _fts_usable(conn):
+        conn.execute("INSERT INTO memories_fts(memories_fts) VALUES ('rebuild')")
+        conn.execute("DELETE FROM memories_search_stale")
+        conn.commit()
     logger.info("Database vacuumed successfully")
 
 
@@ -1443,3 +1895,37 @@ def quick_save(
 
     with db_connection() as conn:
         return create_memory(conn, memory)
+
+
+def bulk_quick_save(
+    memories: List[Dict[str, Any]],
+    project_id: Optional[str] = None,
+    session_id: Optional[str] = None
+) -> List[str]:
+    """
+    Save several memories on one connection in one transaction.
+
+    Burst-save counterpart to quick_save: one connection and one commit for
+    the whole batch instead of one per memory (see create_memories). Every
+    payload is validated before anything is written.
+
+    Args:
+        memories: Memory dictionaries (same fields as create_memory).
+        project_id: Project identifier for memories that do not set one.
+        session_id: Session identifier for memories that do not set one.
+
+    Returns:
+        The IDs of the created memories, in input order.
+    """
+    if project_id is not None or session_id is not None:
+        memories = [
+            {
+                **memory,
+                "project_id": memory.get("project_id") or project_id,
+                "session_id": memory.get("session_id") or session_id,
+            }
+            for memory in memories
+        ]
+
+    with db_connection() as conn:
+        return create_memories(conn, memories)
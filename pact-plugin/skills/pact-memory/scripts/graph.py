@@ -327,6 +327,52 @@ def get_files_for_memory(
     return [dict(row) for row in cursor.fetchall()]
 
 
+# Bound on memory IDs per IN (...) query, under SQLite's historical
+# 999-variable limit.
+_IN_CHUNK = 500
+
+
+def get_file_paths_for_memories(
+    conn: sqlite3.Connection,
+    memory_ids: List[str]
+) -> Dict[str, List[str]]:
+    """
+    Get linked file paths for many memories in one query per chunk.
+
+    Batch counterpart of get_files_for_memory for callers hydrating a page
+    of memories; paths keep get_files_for_memory's (relationship, path)
+    order.
+
+    Args:
+        conn: Active database connection.
+        memory_ids: Memory IDs to look up.
+
+    Returns:
+        Dict mapping each memory ID to its file paths ([] if none).
+    """
+    ensure_initialized(conn)
+
+    paths: Dict[str, List[str]] = {memory_id: [] for memory_id in memory_ids}
+    unique_ids = list(paths)
+    for i in range(0, len(unique_ids), _IN_CHUNK):
+        chunk = unique_ids[i:i + _IN_CHUNK]
+        placeholders = ",".join("?" * len(chunk))
+        cursor = conn.execute(
+            f"""
+            SELECT mf.memory_id, f.path
+            FROM files f
+            JOIN memory_files mf ON f.id = mf.file_id
+            WHERE mf.memory_id IN ({placeholders})
+            ORDER BY mf.memory_id, mf.relationship, f.path
+            """,
+            chunk
+        )
+        for memory_id, path in cursor.fetchall():
+            paths[memory_id].append(path)
+
+    return paths
+
+
 def get_memories_for_file(
     conn: sqlite3.Connection,
     file_id: str
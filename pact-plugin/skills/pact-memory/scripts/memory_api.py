@@ -51,7 +51,8 @@ from .embeddings import (
 )
 from .graph import (
     link_memory_to_paths,
-    get_files_for_memory
+    get_files_for_memory,
+    get_file_paths_for_memories
 )
 from .models import MemoryObject, memory_from_db_row
 from .search import (
@@ -778,13 +779,14 @@ class PACTMemory:
                 limit=limit
             )
 
-            memories = []
-            for memory_dict in memories_data:
-                files_data = get_files_for_memory(conn, memory_dict["id"])
-                file_paths = [f["path"] for f in files_data]
-                memories.append(memory_from_db_row(memory_dict, file_paths))
-
-            return memories
+            # One files query for the whole page instead of one per memory.
+            files_by_id = get_file_paths_for_memories(
+                conn, [memory_dict["id"] for memory_dict in memories_data]
+            )
+            return [
+                memory_from_db_row(memory_dict, files_by_id[memory_dict["id"]])
+                for memory_dict in memories_data
+            ]
 
     def get_status(self) -> Dict[str, Any]:
         """
@@ -12,14 +12,44 @@ Used by:
 - search.py: Search results returned as MemoryObject instances
 """
 
+from __future__ import annotations
+
+import functools
 import json
 import logging
+import sys
 from dataclasses import dataclass, field, fields as dataclass_fields
 from datetime import datetime
-from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Union
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional
+
+# orjson (optional) parses several times faster than stdlib json; fall back
+# to stdlib when it is not installed. orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so the existing except clauses cover both.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# ciso8601 (optional) parses ISO 8601 timestamps, including a trailing "Z",
+# in C; _parse_datetime_str falls back to the stdlib parsers without it or
+# when it rejects a value.
+try:
+    from ciso8601 import parse_datetime as _parse_iso_c
+except ImportError:
+    _parse_iso_c = None
+
+# datetime.fromisoformat accepts a trailing "Z" natively from 3.11.
+_FROMISO_NEEDS_Z_REWRITE = sys.version_info < (3, 11)
 
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses (no per-instance __dict__) where supported: every
+# hydrated memory carries lists of TaskItem/Decision/Entity, so this trims
+# memory and attribute lookups per row. dataclass(slots=) is 3.10+.
+_DATACLASS_OPTIONS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
 
 # =============================================================================
 # Bug 3 fix (#374) — strict-on-write / lenient-on-read key validation
@@ -56,9 +86,11 @@ def _validate_from_dict_keys(
 
     Returns a (potentially cleaned) copy of `data` where every key is allowed.
     """
-    unknown = sorted(set(data.keys()) - allowed)
-    if not unknown:
+    # Fast path for the common all-known case: one C-level subset check,
+    # no set difference or sort.
+    if allowed.issuperset(data):
         return data
+    unknown = sorted(set(data.keys()) - allowed)
     if strict:
         raise ValueError(
             f"Unknown keys for {cls.__name__}: {unknown}. "
@@ -74,7 +106,7 @@ def _validate_from_dict_keys(
     return {k: v for k, v in data.items() if k in allowed}
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TaskItem:
     """
     Represents a task within a memory.
@@ -94,7 +126,7 @@ class TaskItem:
     @classmethod
     def from_dict(
         cls,
-        data: Union[Dict[str, Any], str],
+        data: Dict[str, Any] | str,
         *,
         strict: bool = False,
         memory_id: Optional[str] = None,
@@ -111,6 +143,22 @@ class TaskItem:
         """
         if isinstance(data, str):
             return cls(task=data)
+        return cls._from_mapping(data, strict=strict, memory_id=memory_id)
+
+    @classmethod
+    def _from_mapping(
+        cls,
+        data: Dict[str, Any],
+        *,
+        strict: bool = False,
+        memory_id: Optional[str] = None,
+    ) -> "TaskItem":
+        """
+        Create TaskItem from a dict (no str dispatch).
+
+        MemoryObject.from_dict calls this directly once it has checked the
+        item type, skipping from_dict's per-item isinstance.
+        """
         data = _validate_from_dict_keys(
             cls, cls._ALLOWED_KEYS, data, strict=strict, context=memory_id,
         )
@@ -128,7 +176,7 @@ class TaskItem:
         return result
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Decision:
     """
     Represents a decision made during development.
@@ -148,7 +196,7 @@ class Decision:
     @classmethod
     def from_dict(
         cls,
-        data: Union[Dict[str, Any], str],
+        data: Dict[str, Any] | str,
         *,
         strict: bool = False,
         memory_id: Optional[str] = None,
@@ -156,6 +204,17 @@ class Decision:
         """Create Decision from dict or string. See TaskItem.from_dict for arg docs."""
         if isinstance(data, str):
             return cls(decision=data)
+        return cls._from_mapping(data, strict=strict, memory_id=memory_id)
+
+    @classmethod
+    def _from_mapping(
+        cls,
+        data: Dict[str, Any],
+        *,
+        strict: bool = False,
+        memory_id: Optional[str] = None,
+    ) -> "Decision":
+        """Create Decision from a dict. See TaskItem._from_mapping."""
         data = _validate_from_dict_keys(
             cls, cls._ALLOWED_KEYS, data, strict=strict, context=memory_id,
         )
@@ -175,7 +234,7 @@ class Decision:
         return result
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Entity:
     """
     Represents an entity referenced in a memory (component, service, etc.).
@@ -195,7 +254,7 @@ class Entity:
     @classmethod
     def from_dict(
         cls,
-        data: Union[Dict[str, Any], str],
+        data: Dict[str, Any] | str,
         *,
         strict: bool = False,
         memory_id: Optional[str] = None,
@@ -203,6 +262,17 @@ class Entity:
         """Create Entity from dict or string. See TaskItem.from_dict for arg docs."""
         if isinstance(data, str):
             return cls(name=data)
+        return cls._from_mapping(data, strict=strict, memory_id=memory_id)
+
+    @classmethod
+    def _from_mapping(
+        cls,
+        data: Dict[str, Any],
+        *,
+        strict: bool = False,
+        memory_id: Optional[str] = None,
+    ) -> "Entity":
+        """Create Entity from a dict. See TaskItem._from_mapping."""
         data = _validate_from_dict_keys(
             cls, cls._ALLOWED_KEYS, data, strict=strict, context=memory_id,
         )
@@ -263,17 +333,49 @@ def _parse_string_list(raw: Any) -> List[str]:
     if not raw:
         return []
     if isinstance(raw, list):
+        # Rows almost always carry list[str] already; skip the per-item
+        # str() pass then. Copy so the model never aliases the caller's list.
+        if all(type(item) is str for item in raw):
+            return raw[:]
         return [str(item) for item in raw if item is not None]
     if isinstance(raw, str):
         try:
-            parsed = json.loads(raw)
-            return [str(item) for item in parsed if item is not None] if isinstance(parsed, list) else [raw]
+            parsed = _json_loads(raw)
+            if not isinstance(parsed, list):
+                return [raw]
+            # Freshly decoded, so no copy is needed on the fast path.
+            if all(type(item) is str for item in parsed):
+                return parsed
+            return [str(item) for item in parsed if item is not None]
         except json.JSONDecodeError:
             return [raw] if raw else []
     return []
 
 
-@dataclass
+def _parse_object_list(raw: Any, str_key: str) -> Any:
+    """
+    Normalize a field that should be a list of objects (tasks, decisions,
+    entities) for the per-item from_dict calls.
+
+    - None/empty/falsy: returns []
+    - str: a JSON array is returned parsed; any other JSON value or a plain
+      (non-JSON) string becomes a single item `[{str_key: raw}]`
+    - anything else (normally an already-deserialized list) is returned as-is
+
+    None items are left in place; callers filter them.
+    """
+    if not raw:
+        return []
+    if isinstance(raw, str):
+        try:
+            parsed = _json_loads(raw)
+        except json.JSONDecodeError:
+            return [{str_key: raw}]
+        return parsed if isinstance(parsed, list) else [{str_key: raw}]
+    return raw
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class MemoryObject:
     """
     Rich memory object representing a saved context.
@@ -330,45 +432,27 @@ class MemoryObject:
         Returns:
             MemoryObject instance.
         """
-        # Parse active_tasks
-        raw_tasks = data.get("active_tasks") or []
-        if isinstance(raw_tasks, str):
-            # Handle JSON string or plain string
-            try:
-                parsed = json.loads(raw_tasks)
-                raw_tasks = parsed if isinstance(parsed, list) else [{"task": raw_tasks}]
-            except json.JSONDecodeError:
-                # Plain string - treat as a single task
-                raw_tasks = [{"task": raw_tasks}] if raw_tasks else []
-        # Filter out None values in the list
-        active_tasks = [TaskItem.from_dict(t) for t in raw_tasks if t is not None]
+        # Items are dispatched here (str vs mapping) rather than through the
+        # sub-objects' from_dict, saving one call frame per item.
+        active_tasks = [
+            TaskItem(task=t) if isinstance(t, str) else TaskItem._from_mapping(t)
+            for t in _parse_object_list(data.get("active_tasks"), "task")
+            if t is not None
+        ]
 
         # Parse lessons_learned (simple string list — uses shared helper)
         lessons_learned = _parse_string_list(data.get("lessons_learned"))
 
-        # Parse decisions
-        raw_decisions = data.get("decisions") or []
-        if isinstance(raw_decisions, str):
-            try:
-                parsed = json.loads(raw_decisions)
-                raw_decisions = parsed if isinstance(parsed, list) else [{"decision": raw_decisions}]
-            except json.JSONDecodeError:
-                # Plain string - treat as a single decision
-                raw_decisions = [{"decision": raw_decisions}] if raw_decisions else []
-        # Filter out None values
-        decisions = [Decision.from_dict(d) for d in raw_decisions if d is not None]
-
-        # Parse entities
-        raw_entities = data.get("entities") or []
-        if isinstance(raw_entities, str):
-            try:
-                parsed = json.loads(raw_entities)
-                raw_entities = parsed if isinstance(parsed, list) else [{"name": raw_entities}]
-            except json.JSONDecodeError:
-                # Plain string - treat as a single entity
-                raw_entities = [{"name": raw_entities}] if raw_entities else []
-        # Filter out None values
-        entities = [Entity.from_dict(e) for e in raw_entities if e is not None]
+        decisions = [
+            Decision(decision=d) if isinstance(d, str) else Decision._from_mapping(d)
+            for d in _parse_object_list(data.get("decisions"), "decision")
+            if d is not None
+        ]
+        entities = [
+            Entity(name=e) if isinstance(e, str) else Entity._from_mapping(e)
+            for e in _parse_object_list(data.get("entities"), "name")
+            if e is not None
+        ]
 
         # Parse CT fields (simple string lists, same pattern as lessons_learned)
         reasoning_chains = _parse_string_list(data.get("reasoning_chains"))
@@ -379,7 +463,7 @@ class MemoryObject:
         files = data.get("files") or []
         if isinstance(files, str):
             try:
-                files = json.loads(files)
+                files = _json_loads(files)
             except json.JSONDecodeError:
                 files = [files] if files else []
 
@@ -476,8 +560,10 @@ class MemoryObject:
         if self.goal:
             parts.append(f"Goal: {self.goal}")
 
+        # join() materializes its argument anyway, so list comprehensions
+        # (not generators) below skip the generator frame per item.
         if self.active_tasks:
-            task_text = "; ".join(t.task for t in self.active_tasks)
+            task_text = "; ".join([t.task for t in self.active_tasks])
             parts.append(f"Tasks: {task_text}")
 
         if self.lessons_learned:
@@ -485,19 +571,17 @@ class MemoryObject:
             parts.append(f"Lessons: {lessons_text}")
 
         if self.decisions:
-            decision_texts = []
-            for d in self.decisions:
-                text = d.decision
-                if d.rationale:
-                    text += f" ({d.rationale})"
-                decision_texts.append(text)
-            parts.append(f"Decisions: {'; '.join(decision_texts)}")
+            decision_text = "; ".join([
+                f"{d.decision} ({d.rationale})" if d.rationale else d.decision
+                for d in self.decisions
+            ])
+            parts.append(f"Decisions: {decision_text}")
 
         if self.entities:
-            entity_text = ", ".join(
+            entity_text = ", ".join([
                 f"{e.name} ({e.type})" if e.type else e.name
                 for e in self.entities
-            )
+            ])
             parts.append(f"Entities: {entity_text}")
 
         if self.reasoning_chains:
@@ -538,17 +622,36 @@ def _parse_datetime(value: Any) -> Optional[datetime]:
     if isinstance(value, datetime):
         return value
     if isinstance(value, str):
-        # Try ISO format
+        return _parse_datetime_str(value)
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_datetime_str(value: str) -> Optional[datetime]:
+    """String branch of _parse_datetime, memoized.
+
+    datetimes are immutable, so cached results are safe to share. A fresh
+    row's updated_at usually equals its created_at, and list/search pages
+    re-hydrate the same rows repeatedly.
+    """
+    if _parse_iso_c is not None:
         try:
-            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+            return _parse_iso_c(value)
         except ValueError:
-            pass
-        # Try common formats
-        for fmt in ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d"]:
-            try:
-                return datetime.strptime(value, fmt)
-            except ValueError:
-                continue
+            pass  # Fall through to the stdlib parsers
+    # Try ISO format
+    try:
+        if _FROMISO_NEEDS_Z_REWRITE and value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    # Try common formats
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
     return None
 
 
@@ -27,7 +27,7 @@ from .database import (
     db_connection,
     ensure_initialized,
     get_memory,
-    search_memories_by_text,
+    search_memory_ids_by_text,
     SQLITE_EXTENSIONS_ENABLED
 )
 from .embeddings import (
@@ -37,6 +37,7 @@ from .embeddings import (
 )
 from .graph import (
     get_file_id,
+    get_file_paths_for_memories,
     get_memories_for_file,
     get_memories_for_files,
     get_related_files,
@@ -156,8 +157,7 @@ def keyword_search(
     Returns:
         List of memory IDs matching the query.
     """
-    results = search_memories_by_text(conn, query, project_id, limit)
-    return [r["id"] for r in results]
+    return search_memory_ids_by_text(conn, query, project_id, limit)
 
 
 def semantic_search(
@@ -332,19 +332,9 @@ def graph_enhanced_search(
         )
 
         # Fetch full memory objects
-        memories = []
-        for memory_id, score in ranked_results:
-            memory_dict = get_memory(conn, memory_id)
-            if memory_dict:
-                # Get associated files
-                from .graph import get_files_for_memory
-                files_data = get_files_for_memory(conn, memory_id)
-                file_paths = [f["path"] for f in files_data]
-
-                memory_obj = memory_from_db_row(memory_dict, file_paths)
-                memories.append(memory_obj)
-
-        return memories
+        return _hydrate_memories(
+            conn, [memory_id for memory_id, _score in ranked_results]
+        )
 
 
 def find_similar_memories(
@@ -416,18 +406,31 @@ def search_by_file(
         memory_ids = _get_graph_related_memories(conn, file_path, project_id)
 
         # Fetch and return memory objects
-        memories = []
-        for memory_id in list(memory_ids)[:limit]:
-            memory_dict = get_memory(conn, memory_id)
-            if memory_dict:
-                from .graph import get_files_for_memory
-                files_data = get_files_for_memory(conn, memory_id)
-                file_paths = [f["path"] for f in files_data]
-
-                memory_obj = memory_from_db_row(memory_dict, file_paths)
-                memories.append(memory_obj)
-
-        return memories
+        return _hydrate_memories(conn, list(memory_ids)[:limit])
+
+
+def _hydrate_memories(
+    conn: sqlite3.Connection,
+    memory_ids: List[str]
+) -> List[MemoryObject]:
+    """
+    Load MemoryObjects for memory_ids in order, skipping missing IDs.
+
+    Linked file paths come from one batched graph query rather than one
+    query per memory.
+    """
+    memory_dicts = [
+        memory_dict for memory_dict in
+        (get_memory(conn, memory_id) for memory_id in memory_ids)
+        if memory_dict
+    ]
+    files_by_id = get_file_paths_for_memories(
+        conn, [memory_dict["id"] for memory_dict in memory_dicts]
+    )
+    return [
+        memory_from_db_row(memory_dict, files_by_id[memory_dict["id"]])
+        for memory_dict in memory_dicts
+    ]
 
 
 def get_search_capabilities() -> Dict[str, Any]:
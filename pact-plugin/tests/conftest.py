@@ -200,6 +200,43 @@ def _resync_staleness_resolver_bindings():
     _resync()
 
 
+@pytest.fixture(autouse=True)
+def _reset_staleness_git_root_cache():
+    """Unconditional cross-test isolation for ``staleness._git_repo_root``'s
+    ``@lru_cache``. Runs for EVERY test (autouse).
+
+    The cache is keyed on the cwd string only, but tests vary the git result
+    under the SAME cwd by patching ``subprocess.run`` — an uncleared cache
+    would hand a later test the previous test's (mocked) repo root. Cleared
+    before AND after every test, mirroring ``_reset_specialist_registry_cache``.
+    Gated on ``sys.modules`` (like the resync fixture above) so it never forces
+    the staleness import itself.
+    """
+    def _clear():
+        st = sys.modules.get("staleness")
+        cached = getattr(st, "_git_repo_root", None)
+        if cached is not None:
+            cached.cache_clear()
+
+    _clear()
+    yield
+    _clear()
+
+
+@pytest.fixture(autouse=True)
+def _drain_memory_connection_pool():
+    """Close pooled default-DB connections from ``database.db_connection``
+    after every test (autouse), so a connection opened against one test's
+    patched DB_PATH (or a since-deleted file at the same path) never serves
+    the next test. Gated on ``sys.modules`` so it never forces the import.
+    """
+    yield
+    db = sys.modules.get("scripts.database")
+    drain = getattr(db, "_drain_pool", None)
+    if drain is not None:
+        drain()
+
+
 @pytest.fixture(autouse=True)
 def _restore_claude_project_dir_env():
     """Snapshot + restore ``os.environ['CLAUDE_PROJECT_DIR']`` around every test
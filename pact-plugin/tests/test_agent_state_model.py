@@ -17,8 +17,9 @@ VARIETY_PATH = Path(__file__).parent.parent / "protocols" / "pact-variety.md"
 class TestAgentStateModel:
     """Tests for agent state model in variety protocol."""
 
-    @pytest.fixture
-    def variety_content(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def variety_content(cls):
         return VARIETY_PATH.read_text(encoding="utf-8")
 
     def test_agent_state_model_section_exists(self, variety_content):
@@ -108,8 +108,9 @@ class TestCalibrationRecordSchema:
 class TestSchemaProtocolConsistency:
     """Verify CalibrationRecord fields match pact-variety.md protocol text."""
 
-    @pytest.fixture
-    def variety_content(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def variety_content(cls):
         return VARIETY_PROTOCOL.read_text(encoding="utf-8")
 
     def test_protocol_has_calibration_record_section(self, variety_content):
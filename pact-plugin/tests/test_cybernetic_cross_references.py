@@ -53,8 +53,9 @@ class TestAuditProtocolExists:
 class TestVarietyThresholdConsistency:
     """Verify variety_scorer.py constants match pact-variety.md protocol."""
 
-    @pytest.fixture
-    def variety_content(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def variety_content(cls):
         return (PROTOCOLS_DIR / "pact-variety.md").read_text(encoding="utf-8")
 
     def test_compact_range_in_protocol(self, variety_content):
@@ -194,8 +195,9 @@ class TestAuditorDispatchConsistency:
 class TestCalibrationFieldConsistency:
     """Verify CalibrationRecord fields are consistent across docs."""
 
-    @pytest.fixture
-    def variety_content(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def variety_content(cls):
         return (PROTOCOLS_DIR / "pact-variety.md").read_text(encoding="utf-8")
 
     EXPECTED_FIELDS = [
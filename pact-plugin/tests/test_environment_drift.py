@@ -6,6 +6,7 @@ Tests cover:
 2. get_environment_delta excludes edits by the requesting agent
 3. get_environment_delta returns empty dict when no edits exist
 4. get_environment_delta handles corrupted tracking JSON
+5. get_environment_delta tolerates out-of-order and untimed JSONL lines
 """
 import json
 import time
@@ -208,3 +209,58 @@ class TestEnvironmentDrift:
             tracking_path=str(tracking_file),
         )
         assert "src/no-ts.ts" not in delta
+
+    def test_jsonl_log_scanned_newest_first(self, tmp_path):
+        """JSONL log: latest editor per file wins and the reverse walk stops
+        at the first entry older than since_ts by more than the reorder
+        margin (older lines are never decoded, so a malformed one there is
+        harmless)."""
+        from file_tracker import _DELTA_REORDER_MARGIN_MS, get_environment_delta
+
+        tracking_file = tmp_path / "file-edits.json"
+        now = time.time_ns() // 1_000_000
+        since = now - 50_000
+        entries = [
+            {"file": "src/old.ts", "agent": "backend-coder", "tool": "Edit",
+             "ts": since - _DELTA_REORDER_MARGIN_MS - 1},
+            {"file": "src/shared.ts", "agent": "backend-coder", "tool": "Edit", "ts": now - 10_000},
+            {"file": "src/shared.ts", "agent": "database-engineer", "tool": "Edit", "ts": now - 5_000},
+        ]
+        tracking_file.write_text(
+            "not valid json{{{\n" + "".join(json.dumps(e) + "\n" for e in entries)
+        )
+
+        delta = get_environment_delta(
+            since_ts=since,
+            requesting_agent="frontend-coder",
+            tracking_path=str(tracking_file),
+        )
+
+        assert delta == {"src/shared.ts": "database-engineer"}
+
+    def test_out_of_order_and_untimed_lines_do_not_hide_older_edits(self, tmp_path):
+        """A slightly older line or a line without ts appended after in-window
+        entries (concurrent appends) is skipped, not treated as the end of
+        the window."""
+        from file_tracker import get_environment_delta
+
+        tracking_file = tmp_path / "file-edits.json"
+        now = time.time_ns() // 1_000_000
+        since = now - 10_000
+        entries = [
+            {"file": "src/auth.ts", "agent": "backend-coder", "tool": "Edit", "ts": now - 8_000},
+            {"file": "src/db.ts", "agent": "database-engineer", "tool": "Edit", "ts": now - 6_000},
+            # Stamped just before since_ts but landed after the lines above.
+            {"file": "src/late.ts", "agent": "backend-coder", "tool": "Edit", "ts": since - 1_000},
+            {"file": "src/no-ts.ts", "agent": "backend-coder", "tool": "Edit"},
+            {"file": "src/bad-ts.ts", "agent": "backend-coder", "tool": "Edit", "ts": "soon"},
+        ]
+        tracking_file.write_text("".join(json.dumps(e) + "\n" for e in entries))
+
+        delta = get_environment_delta(
+            since_ts=since,
+            requesting_agent="frontend-coder",
+            tracking_path=str(tracking_file),
+        )
+
+        assert delta == {"src/auth.ts": "backend-coder", "src/db.ts": "database-engineer"}
@@ -24,6 +24,15 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent / "hooks"))
 
 
+def _read_jsonl(tracking_file):
+    """Parse a JSONL tracking file into a list of entry dicts."""
+    return [
+        json.loads(line)
+        for line in tracking_file.read_text().splitlines()
+        if line.strip()
+    ]
+
+
 class TestFileTracker:
     """Tests for file_tracker.track_edit() and file_tracker.check_conflict()."""
 
@@ -41,11 +50,24 @@ class TestFileTracker:
             tracking_path=str(tracking_file)
         )
 
-        entries = json.loads(tracking_file.read_text())
+        entries = _read_jsonl(tracking_file)
         assert len(entries) == 1
         assert entries[0]["file"] == os.path.realpath(abs_path)
         assert entries[0]["agent"] == "backend-coder"
 
+    def test_records_millisecond_timestamp(self, tmp_path):
+        import time
+        from file_tracker import track_edit
+
+        tracking_file = tmp_path / "file-edits.json"
+        before = time.time_ns() // 1_000_000
+        track_edit("/tmp/a.ts", "backend-coder", "Edit", str(tracking_file))
+        after = time.time_ns() // 1_000_000
+
+        ts = _read_jsonl(tracking_file)[0]["ts"]
+        assert isinstance(ts, int)
+        assert before <= ts <= after
+
     def test_detects_conflict(self, tmp_path):
         from file_tracker import track_edit, check_conflict
 
@@ -88,20 +110,24 @@ class TestFileTracker:
 
         assert conflict is None
 
-    def test_corrupted_tracking_json_treated_as_empty(self, tmp_path):
-        """Corrupted tracking file should be treated as empty list."""
-        from file_tracker import track_edit
+    def test_corrupted_line_skipped_and_append_continues(self, tmp_path):
+        """A corrupted (unterminated) line is skipped; the new record still
+        lands on its own line and parses."""
+        from file_tracker import track_edit, check_conflict
 
         tracking_file = tmp_path / "file-edits.json"
         tracking_file.write_text("not valid json{{{")
 
         abs_path = str(tmp_path / "src" / "auth.ts")
-        # track_edit should overwrite with a fresh single-entry list
         track_edit(abs_path, "backend-coder", "Edit", str(tracking_file))
 
-        entries = json.loads(tracking_file.read_text())
-        assert len(entries) == 1
-        assert entries[0]["file"] == os.path.realpath(abs_path)
+        lines = tracking_file.read_text().splitlines()
+        assert lines[0] == "not valid json{{{"
+        entry = json.loads(lines[1])
+        assert entry["file"] == os.path.realpath(abs_path)
+        conflict = check_conflict(abs_path, "frontend-coder", str(tracking_file))
+        assert conflict is not None
+        assert "backend-coder" in conflict
 
     def test_corrupted_tracking_json_no_conflict(self, tmp_path):
         """check_conflict with corrupted tracking file should return None."""
@@ -115,6 +141,152 @@ class TestFileTracker:
         assert conflict is None
 
 
+class TestJsonlStorage:
+    """The tracking file is append-only JSONL; legacy JSON arrays migrate."""
+
+    def test_appends_one_line_per_edit(self, tmp_path):
+        from file_tracker import track_edit
+
+        tracking_file = tmp_path / "file-edits.json"
+        track_edit("/tmp/a.ts", "backend-coder", "Edit", str(tracking_file))
+        first = tracking_file.read_bytes()
+        track_edit("/tmp/b.ts", "frontend-coder", "Write", str(tracking_file))
+
+        content = tracking_file.read_bytes()
+        # Append-only: the first record's bytes are untouched.
+        assert content.startswith(first)
+        assert content.endswith(b"\n")
+        entries = _read_jsonl(tracking_file)
+        assert [e["agent"] for e in entries] == ["backend-coder", "frontend-coder"]
+
+    def test_legacy_json_array_migrated_on_append(self, tmp_path):
+        from file_tracker import track_edit
+
+        tracking_file = tmp_path / "file-edits.json"
+        legacy = [{"file": "/tmp/a.ts", "agent": "backend-coder", "tool": "Edit", "ts": 1}]
+        tracking_file.write_text(json.dumps(legacy))
+
+        track_edit("/tmp/b.ts", "frontend-coder", "Edit", str(tracking_file))
+
+        entries = _read_jsonl(tracking_file)
+        assert len(entries) == 2
+        assert entries[0] == legacy[0]
+        assert entries[1]["agent"] == "frontend-coder"
+
+    def test_legacy_json_array_read_without_migration(self, tmp_path):
+        from file_tracker import check_conflict
+
+        tracking_file = tmp_path / "file-edits.json"
+        legacy = [{"file": "/tmp/a.ts", "agent": "backend-coder", "tool": "Edit", "ts": 1}]
+        tracking_file.write_text(json.dumps(legacy))
+
+        conflict = check_conflict("/tmp/a.ts", "frontend-coder", str(tracking_file))
+        assert conflict is not None
+        assert "backend-coder" in conflict
+
+    def test_check_conflict_caps_collected_editors(self, tmp_path):
+        """check_conflict scans newest-first and stops after
+        _MAX_CONFLICT_EDITORS distinct other editors."""
+        from file_tracker import _MAX_CONFLICT_EDITORS, check_conflict, track_edit
+
+        tracking_file = str(tmp_path / "file-edits.json")
+        abs_path = str(tmp_path / "src" / "auth.ts")
+        total = _MAX_CONFLICT_EDITORS + 2
+        for i in range(total):
+            track_edit(abs_path, f"coder-{i:02d}", "Edit", tracking_file)
+
+        conflict = check_conflict(abs_path, "frontend-coder", tracking_file)
+        assert conflict is not None
+        named = [i for i in range(total) if f"coder-{i:02d}" in conflict]
+        # Only the most recent editors are named.
+        assert named == list(range(total - _MAX_CONFLICT_EDITORS, total))
+
+
+class TestCompaction:
+    """track_edit compacts the log once it grows past the size threshold."""
+
+    def test_stale_entries_dropped_when_threshold_exceeded(self, tmp_path, monkeypatch):
+        import time
+        import file_tracker
+        from file_tracker import track_edit
+
+        tracking_file = tmp_path / "file-edits.json"
+        stale_ts = time.time_ns() // 1_000_000 - (file_tracker._COMPACT_KEEP_SECONDS + 60) * 1000
+        stale = {"file": "/tmp/old.ts", "agent": "backend-coder", "tool": "Edit", "ts": stale_ts}
+        tracking_file.write_text(json.dumps(stale) + "\nnot valid json{{{\n")
+
+        monkeypatch.setattr(file_tracker, "_COMPACT_THRESHOLD_BYTES", 1)
+        track_edit("/tmp/new.ts", "frontend-coder", "Edit", str(tracking_file))
+
+        entries = _read_jsonl(tracking_file)
+        assert [e["agent"] for e in entries] == ["frontend-coder"]
+
+    def test_keeps_newest_entries_up_to_cap(self, tmp_path, monkeypatch):
+        import file_tracker
+        from file_tracker import track_edit
+
+        tracking_file = tmp_path / "file-edits.json"
+        for i in range(5):
+            track_edit(f"/tmp/{i}.ts", f"coder-{i}", "Edit", str(tracking_file))
+
+        monkeypatch.setattr(file_tracker, "_COMPACT_THRESHOLD_BYTES", 1)
+        monkeypatch.setattr(file_tracker, "_COMPACT_KEEP_ENTRIES", 3)
+        track_edit("/tmp/5.ts", "coder-5", "Edit", str(tracking_file))
+
+        entries = _read_jsonl(tracking_file)
+        assert [e["agent"] for e in entries] == ["coder-3", "coder-4", "coder-5"]
+
+    def test_no_compaction_below_threshold(self, tmp_path):
+        from file_tracker import track_edit
+
+        tracking_file = tmp_path / "file-edits.json"
+        stale = {"file": "/tmp/old.ts", "agent": "backend-coder", "tool": "Edit", "ts": 1}
+        tracking_file.write_text(json.dumps(stale) + "\n")
+
+        track_edit("/tmp/new.ts", "frontend-coder", "Edit", str(tracking_file))
+
+        assert len(_read_jsonl(tracking_file)) == 2
+
+
+class TestAtomicAppend:
+    """Small records take the lock-free O_APPEND path; anything needing
+    maintenance falls back to the flock path."""
+
+    @pytest.mark.skipif(
+        sys.platform == "win32",
+        reason="fcntl not available on Windows"
+    )
+    def test_small_record_skips_flock(self, tmp_path):
+        import file_tracker
+        from file_tracker import track_edit
+
+        tracking_file = tmp_path / "file-edits.json"
+        with patch.object(file_tracker.fcntl, "flock") as mock_flock:
+            track_edit("/tmp/a.ts", "backend-coder", "Edit", str(tracking_file))
+            track_edit("/tmp/b.ts", "frontend-coder", "Edit", str(tracking_file))
+
+        mock_flock.assert_not_called()
+        assert len(_read_jsonl(tracking_file)) == 2
+
+    @pytest.mark.skipif(
+        sys.platform == "win32",
+        reason="fcntl not available on Windows"
+    )
+    def test_oversize_record_takes_locked_path(self, tmp_path):
+        import file_tracker
+        from file_tracker import track_edit
+
+        tracking_file = tmp_path / "file-edits.json"
+        long_path = "/tmp/" + "x" * file_tracker._MAX_ATOMIC_LINE_BYTES
+        with patch.object(
+            file_tracker.fcntl, "flock", wraps=file_tracker.fcntl.flock
+        ) as spy_flock:
+            track_edit(long_path, "backend-coder", "Edit", str(tracking_file))
+
+        assert spy_flock.call_count == 2  # LOCK_EX + LOCK_UN
+        assert _read_jsonl(tracking_file)[0]["agent"] == "backend-coder"
+
+
 class TestPathNormalization:
     """Tests for _normalize_path and its effect on conflict detection."""
 
@@ -128,7 +300,7 @@ class TestPathNormalization:
         monkeypatch.chdir(tmp_path)
         track_edit("src/auth.ts", "backend-coder", "Edit", str(tracking_file))
 
-        entries = json.loads(tracking_file.read_text())
+        entries = _read_jsonl(tracking_file)
         assert len(entries) == 1
         # The stored path should be absolute (resolved from cwd)
         assert entries[0]["file"] == str(tmp_path / "src" / "auth.ts")
@@ -183,8 +355,8 @@ class TestLockRelease:
         tracking_file = tmp_path / "file-edits.json"
         tracking_file.write_text("[]")
 
-        # Patch json.dumps to raise during the write phase (after lock acquired)
-        with patch("file_tracker.json.dumps", side_effect=RuntimeError("boom")):
+        # Patch the record encoder to raise during the write phase
+        with patch("file_tracker._json_dumps", side_effect=RuntimeError("boom")):
             with pytest.raises(RuntimeError, match="boom"):
                 track_edit("/tmp/test.ts", "agent-a", "Edit", str(tracking_file))
 
@@ -222,8 +394,8 @@ class TestMainEntryPoint:
         with patch("file_tracker.get_team_name", return_value="pact-test"), \
              patch("file_tracker.pact_context.init"), \
              patch("file_tracker.resolve_agent_name", return_value="backend-coder"), \
-             patch("file_tracker.check_conflict", return_value=None), \
-             patch("file_tracker.track_edit"), \
+             patch("file_tracker._find_conflict", return_value=None), \
+             patch("file_tracker._append_edit"), \
              patch("sys.stdin", io.StringIO(input_data)):
             with pytest.raises(SystemExit) as exc_info:
                 main()
@@ -264,8 +436,8 @@ class TestMainEntryPoint:
         with patch("file_tracker.get_team_name", return_value="pact-test"), \
              patch("file_tracker.pact_context.init"), \
              patch("file_tracker.resolve_agent_name", return_value="frontend-coder"), \
-             patch("file_tracker.check_conflict", return_value=conflict_msg), \
-             patch("file_tracker.track_edit"), \
+             patch("file_tracker._find_conflict", return_value=conflict_msg), \
+             patch("file_tracker._append_edit"), \
              patch("sys.stdin", io.StringIO(input_data)):
             with pytest.raises(SystemExit) as exc_info:
                 main()
@@ -357,7 +529,7 @@ class TestFileTrackerCompositeKey:
         abs_path = str(tmp_path / "src" / "auth.ts")
         track_edit(abs_path, "backend-coder", "Edit", str(tracking_file), session_id="sess-xyz")
 
-        entries = json.loads(tracking_file.read_text())
+        entries = _read_jsonl(tracking_file)
         assert entries[0]["session_id"] == "sess-xyz"
         assert entries[0]["agent"] == "backend-coder"  # label retained
 
@@ -374,3 +546,103 @@ class TestFileTrackerCompositeKey:
         assert conflict is not None
         assert "frontend-coder" in conflict
         assert "session" not in conflict  # unambiguous single editor → no suffix
+
+
+class TestProjectScopeGate:
+    """main() skips edits outside the project dir before any tracking I/O."""
+
+    def test_is_project_file(self, tmp_path):
+        from file_tracker import _is_project_file
+
+        project = tmp_path / "proj"
+        project.mkdir()
+        assert _is_project_file(str(project / "src" / "a.ts"), str(project))
+        assert _is_project_file(
+            str(project / ".worktrees" / "feat" / "a.ts"), str(project)
+        )
+        assert not _is_project_file(str(tmp_path / "other" / "a.ts"), str(project))
+        # Sibling dir sharing the name prefix is NOT inside.
+        assert not _is_project_file(str(tmp_path / "proj-b" / "a.ts"), str(project))
+        # Unknown project dir admits everything.
+        assert _is_project_file("/tmp/a.ts", "")
+
+    def test_main_skips_file_outside_project(self, tmp_path, capsys):
+        from file_tracker import main
+
+        project = tmp_path / "proj"
+        project.mkdir()
+        input_data = json.dumps({
+            "tool_input": {"file_path": str(tmp_path / "scratch.ts")},
+            "tool_name": "Write",
+        })
+
+        with patch("file_tracker.get_team_name", return_value="pact-test"), \
+             patch("file_tracker.pact_context.init"), \
+             patch("file_tracker.get_project_dir", return_value=str(project)), \
+             patch("file_tracker._find_conflict") as mock_check, \
+             patch("file_tracker._append_edit") as mock_track, \
+             patch("sys.stdin", io.StringIO(input_data)):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 0
+        mock_check.assert_not_called()
+        mock_track.assert_not_called()
+        assert json.loads(capsys.readouterr().out) == {"suppressOutput": True}
+
+    def test_nested_project_admits_repo_root_worktrees(self, tmp_path):
+        """Worktrees live at $REPO_ROOT/.worktrees, outside a nested project."""
+        from file_tracker import _is_project_file
+
+        repo = tmp_path / "repo"
+        (repo / ".git").mkdir(parents=True)
+        project = repo / "packages" / "app"
+        project.mkdir(parents=True)
+        worktree_file = repo / ".worktrees" / "feat" / "packages" / "app" / "a.ts"
+
+        assert _is_project_file(str(worktree_file), str(project))
+        # Elsewhere in the repo but outside the project is still skipped.
+        assert not _is_project_file(str(repo / "docs" / "a.md"), str(project))
+
+    def test_linked_worktree_project_admits_sibling_worktrees(self, tmp_path):
+        """A project dir inside a linked worktree resolves to the main checkout."""
+        from file_tracker import _is_project_file
+
+        repo = tmp_path / "repo"
+        (repo / ".git" / "worktrees" / "feat").mkdir(parents=True)
+        worktree = repo / ".worktrees" / "feat"
+        project = worktree / "app"
+        project.mkdir(parents=True)
+        (worktree / ".git").write_text(
+            f"gitdir: {repo / '.git' / 'worktrees' / 'feat'}\n"
+        )
+
+        assert _is_project_file(
+            str(repo / ".worktrees" / "other" / "app" / "a.ts"), str(project)
+        )
+
+    def test_main_tracks_worktree_edit_for_nested_project(self, tmp_path, capsys):
+        from file_tracker import main
+
+        repo = tmp_path / "repo"
+        (repo / ".git").mkdir(parents=True)
+        project = repo / "packages" / "app"
+        project.mkdir(parents=True)
+        worktree_file = repo / ".worktrees" / "feat" / "packages" / "app" / "a.ts"
+        input_data = json.dumps({
+            "tool_input": {"file_path": str(worktree_file)},
+            "tool_name": "Edit",
+        })
+
+        with patch("file_tracker.get_team_name", return_value="pact-test"), \
+             patch("file_tracker.pact_context.init"), \
+             patch("file_tracker.get_project_dir", return_value=str(project)), \
+             patch("file_tracker._find_conflict", return_value=None) as mock_check, \
+             patch("file_tracker._append_edit") as mock_track, \
+             patch("sys.stdin", io.StringIO(input_data)):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 0
+        mock_check.assert_called_once()
+        mock_track.assert_called_once()
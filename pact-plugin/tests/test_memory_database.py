@@ -13,6 +13,7 @@ Tests cover:
 """
 import json
 import os
+import sqlite3
 import sys
 from pathlib import Path
 from unittest.mock import patch
@@ -96,6 +97,104 @@ class TestMigrateCTFields:
         conn.close()
 
 
+class TestEnsureInitializedOncePerConnection:
+    def test_pact_connection_initialized_once(self, tmp_path):
+        """get_connection connections skip the catalog check and migrations
+        after the first ensure_initialized; a new connection re-checks."""
+        from scripts.database import ensure_initialized, get_connection
+        db_path = tmp_path / "once.db"
+        with patch("scripts.database._init_vector_table", return_value=False) as vec:
+            conn = get_connection(db_path)
+            ensure_initialized(conn)  # fresh DB: full schema
+            ensure_initialized(conn)
+            ensure_initialized(conn)
+            assert vec.call_count == 1
+            conn.close()
+
+            conn = get_connection(db_path)
+            ensure_initialized(conn)  # existing DB: migrations + vec table
+            ensure_initialized(conn)
+            assert vec.call_count == 2
+            conn.close()
+
+    def test_plain_connection_checked_every_call(self, tmp_path):
+        from scripts.database import ensure_initialized
+        conn = sqlite3.connect(str(tmp_path / "plain.db"))
+        with patch("scripts.database._init_vector_table", return_value=False) as vec:
+            ensure_initialized(conn)
+            ensure_initialized(conn)
+            ensure_initialized(conn)
+        # First call builds the schema; later calls take the migrate path.
+        assert vec.call_count == 3
+        conn.close()
+
+
+class TestConnectionPragmas:
+    def test_pragmas_applied_on_every_open(self, tmp_path):
+        """WAL is asserted on the first open of a path; the per-connection
+        PRAGMAs apply to every connection, including later reopens."""
+        from scripts import database
+        db_path = tmp_path / "pragmas.db"
+        for _ in range(2):
+            conn = database.get_connection(db_path)
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -20000
+            conn.close()
+        assert str(db_path) in database._WAL_CONFIRMED_PATHS
+
+
+class TestDbConnectionPool:
+    def test_default_path_connection_reused(self, tmp_path):
+        from scripts import database
+        with patch("scripts.database.DB_PATH", tmp_path / "pool.db"), \
+             patch("scripts.database.PACT_MEMORY_DIR", tmp_path):
+            with database.db_connection() as first:
+                first.execute("CREATE TABLE t (x)")
+            with database.db_connection() as second:
+                assert second is first
+                second.execute("INSERT INTO t VALUES (1)")
+            # Committed on exit, visible to an independent connection.
+            other = sqlite3.connect(str(tmp_path / "pool.db"))
+            assert other.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
+            other.close()
+
+    def test_failed_block_not_returned_to_pool(self, tmp_path):
+        from scripts import database
+        with patch("scripts.database.DB_PATH", tmp_path / "pool.db"), \
+             patch("scripts.database.PACT_MEMORY_DIR", tmp_path):
+            with pytest.raises(RuntimeError):
+                with database.db_connection() as failed:
+                    raise RuntimeError("boom")
+            with database.db_connection() as fresh:
+                assert fresh is not failed
+
+    def test_pooled_connection_not_reused_for_other_path(self, tmp_path):
+        from scripts import database
+        with patch("scripts.database.PACT_MEMORY_DIR", tmp_path):
+            with patch("scripts.database.DB_PATH", tmp_path / "a.db"):
+                with database.db_connection() as conn_a:
+                    pass
+            with patch("scripts.database.DB_PATH", tmp_path / "b.db"):
+                with database.db_connection() as conn_b:
+                    assert conn_b is not conn_a
+                    assert conn_b.execute(
+                        "PRAGMA database_list"
+                    ).fetchone()[2].endswith("b.db")
+
+    def test_explicit_path_not_pooled(self, tmp_path):
+        from scripts import database
+        db_path = tmp_path / "explicit.db"
+        with database.db_connection(db_path) as first:
+            pass
+        with database.db_connection(db_path) as second:
+            assert second is not first
+        assert database._POOL.empty()
+
+
 # ---------------------------------------------------------------------------
 # JSON serialization
 # ---------------------------------------------------------------------------
@@ -113,6 +212,15 @@ class TestJsonSerialization:
         assert isinstance(result["active_tasks"], str)
         assert json.loads(result["active_tasks"]) == [{"task": "T1"}]
 
+    def test_serialize_roundtrip_matches_stdlib(self):
+        """Whichever encoder is active, stored JSON decodes to what stdlib
+        json.dumps would have produced (int keys coerced to str)."""
+        from scripts.database import _deserialize_json_fields, _serialize_json_fields
+        value = [{"name": "café ✓", "n": 1.5, "nested": {1: None}}]
+        stored = _serialize_json_fields({"entities": value})
+        assert json.loads(stored["entities"]) == json.loads(json.dumps(value))
+        assert _deserialize_json_fields(stored)["entities"] == json.loads(json.dumps(value))
+
     def test_serialize_leaves_none_alone(self):
         from scripts.database import _serialize_json_fields
         result = _serialize_json_fields({"active_tasks": None, "context": "test"})
@@ -183,6 +291,48 @@ class TestCreateMemory:
         assert result["lessons_learned"] == ["L1"]
 
 
+class TestCreateMemories:
+    def test_creates_all_in_order(self, db_conn):
+        from scripts.database import create_memories, get_memory
+        ids = create_memories(db_conn, [
+            {"id": "batch-1", "context": "First", "lessons_learned": ["L1", "L1"]},
+            {"context": "Second"},
+        ])
+        assert ids[0] == "batch-1"
+        assert len(ids) == 2
+        assert get_memory(db_conn, ids[0])["lessons_learned"] == ["L1"]
+        assert get_memory(db_conn, ids[1])["context"] == "Second"
+
+    def test_empty_batch(self, db_conn):
+        from scripts.database import create_memories
+        assert create_memories(db_conn, []) == []
+
+    def test_invalid_payload_writes_nothing(self, db_conn):
+        """Validation runs for every payload before the batch insert."""
+        from scripts.database import create_memories, get_memory_count
+        with pytest.raises(ValueError):
+            create_memories(db_conn, [{"context": "ok"}, {"bogus": "x"}])
+        assert get_memory_count(db_conn) == 0
+
+
+class TestBulkQuickSave:
+    def test_saves_batch_with_default_scope(self, tmp_path):
+        from scripts.database import (
+            bulk_quick_save, db_connection, get_memory,
+        )
+        db_path = tmp_path / "bulk.db"
+        with patch("scripts.database.DB_PATH", db_path), \
+             patch("scripts.database.PACT_MEMORY_DIR", tmp_path):
+            ids = bulk_quick_save(
+                [{"context": "A"}, {"context": "B", "project_id": "own"}],
+                project_id="proj", session_id="sess",
+            )
+        with db_connection(db_path) as conn:
+            first, second = (get_memory(conn, i) for i in ids)
+        assert (first["context"], first["project_id"]) == ("A", "proj")
+        assert (second["project_id"], second["session_id"]) == ("own", "sess")
+
+
 class TestGetMemory:
     def test_returns_memory(self, db_conn):
         from scripts.database import create_memory, get_memory
@@ -447,6 +597,17 @@ class TestUpdateMemory:
         from scripts.database import update_memory
         assert update_memory(db_conn, "nonexistent", {"context": "X"}) is False
 
+    def test_returns_false_for_missing_on_every_path(self, db_conn):
+        """Missing IDs report False on the additive-merge, replace and
+        nothing-to-write paths, not just the scalar UPDATE."""
+        from scripts.database import update_memory
+        assert update_memory(db_conn, "nonexistent", {"lessons_learned": ["L"]}) is False
+        assert update_memory(
+            db_conn, "nonexistent", {"lessons_learned": ["L"]}, replace=True
+        ) is False
+        assert update_memory(db_conn, "nonexistent", {"id": "nonexistent"}) is False
+        assert update_memory(db_conn, "nonexistent", {"lessons_learned": []}) is False
+
     def test_updates_json_fields(self, db_conn):
         from scripts.database import create_memory, update_memory, get_memory
         mem_id = create_memory(db_conn, {"context": "Test"})
@@ -607,6 +768,14 @@ class TestListMemories:
         create_memory(db_conn, {"context": "B", "session_id": "s2"})
         assert len(list_memories(db_conn, session_id="s1")) == 1
 
+    def test_filters_by_project_and_session(self, db_conn):
+        from scripts.database import create_memory, list_memories
+        create_memory(db_conn, {"context": "A", "project_id": "p1", "session_id": "s1"})
+        create_memory(db_conn, {"context": "B", "project_id": "p1", "session_id": "s2"})
+        create_memory(db_conn, {"context": "C", "project_id": "p2", "session_id": "s1"})
+        results = list_memories(db_conn, project_id="p1", session_id="s1")
+        assert [r["context"] for r in results] == ["A"]
+
     def test_respects_limit(self, db_conn):
         from scripts.database import create_memory, list_memories
         for i in range(5):
@@ -658,6 +827,142 @@ class TestSearchMemoriesByText:
         assert search_memories_by_text(db_conn, "nonexistent") == []
 
 
+class TestSearchMemoriesFts:
+    """search_memories_by_text on a real get_connection DB, where
+    ensure_initialized builds the trigram FTS index."""
+
+    @pytest.fixture
+    def fts_conn(self, tmp_path):
+        from scripts.database import get_connection, _init_fts_table
+        conn = get_connection(tmp_path / "fts.db")
+        with patch("scripts.database._init_vector_table", return_value=False):
+            from scripts.database import ensure_initialized
+            ensure_initialized(conn)
+        if not _init_fts_table(conn):
+            pytest.skip("SQLite build lacks FTS5 trigram tokenizer")
+        yield conn
+        conn.close()
+
+    def test_substring_case_insensitive_like_semantics(self, fts_conn):
+        from scripts.database import create_memory, search_memories_by_text
+        create_memory(fts_conn, {"context": "Working on Authentication"})
+        create_memory(fts_conn, {"lessons_learned": ["100% of tests_pass"]})
+        assert len(search_memories_by_text(fts_conn, "THENTIC")) == 1
+        assert len(search_memories_by_text(fts_conn, "100%")) == 1
+        assert len(search_memories_by_text(fts_conn, "s_p")) == 1
+        assert search_memories_by_text(fts_conn, 'quote"d') == []
+        # Short terms use the LIKE scan.
+        assert len(search_memories_by_text(fts_conn, "on")) == 1
+
+    def test_index_tracks_update_and_delete(self, fts_conn):
+        from scripts.database import (
+            create_memory, delete_memory, search_memories_by_text, update_memory,
+        )
+        mem_id = create_memory(fts_conn, {"context": "alpha topic", "project_id": "p1"})
+        create_memory(fts_conn, {"context": "alpha other", "project_id": "p2"})
+        assert len(search_memories_by_text(fts_conn, "alpha", project_id="p1")) == 1
+
+        update_memory(fts_conn, mem_id, {"context": "beta topic"})
+        assert len(search_memories_by_text(fts_conn, "alpha")) == 1
+        assert len(search_memories_by_text(fts_conn, "beta")) == 1
+
+        delete_memory(fts_conn, mem_id)
+        assert search_memories_by_text(fts_conn, "beta") == []
+
+    def test_id_search_matches_full_search(self, fts_conn):
+        from scripts.database import (
+            create_memory, search_memories_by_text, search_memory_ids_by_text,
+        )
+        create_memory(fts_conn, {"context": "delta one", "project_id": "p1"})
+        create_memory(fts_conn, {"goal": "delta two", "project_id": "p2"})
+        for term, project in (("delta", None), ("delta", "p2"), ("ta", None)):
+            full = search_memories_by_text(fts_conn, term, project_id=project)
+            ids = search_memory_ids_by_text(fts_conn, term, project_id=project)
+            assert ids == [m["id"] for m in full]
+
+    def test_existing_rows_indexed_on_migration(self, tmp_path):
+        """A database created before the index gets its rows indexed."""
+        from scripts.database import (
+            _init_fts_table, get_connection, search_memories_by_text,
+        )
+        conn = get_connection(tmp_path / "legacy.db")
+        create_test_schema(conn)
+        conn.execute("INSERT INTO memories (id, context) VALUES ('m1', 'legacy gamma')")
+        conn.commit()
+        if not _init_fts_table(conn):
+            pytest.skip("SQLite build lacks FTS5 trigram tokenizer")
+        with patch("scripts.database.ensure_initialized"):
+            assert len(search_memories_by_text(conn, "gamma")) == 1
+        conn.close()
+
+    @staticmethod
+    def _swap_tokenizer(db_path, old, new):
+        """Rewrite the stored FTS DDL so fresh connections see `new`."""
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("PRAGMA writable_schema=ON")
+        conn.execute(
+            "UPDATE sqlite_master SET sql = replace(sql, ?, ?) WHERE name = 'memories_fts'",
+            (f"tokenize='{old}'", f"tokenize='{new}'"),
+        )
+        conn.commit()
+        conn.close()
+
+    def test_writes_succeed_without_fts_and_index_rebuilds(self, fts_conn, tmp_path):
+        """A build lacking the tokenizer can still write; the index catches up."""
+        from scripts.database import (
+            create_memory, delete_memory, get_connection, search_memories_by_text,
+            update_memory,
+        )
+        kept = create_memory(fts_conn, {"context": "delta kept"})
+        gone = create_memory(fts_conn, {"context": "delta gone"})
+        fts_conn.close()
+        db_path = tmp_path / "fts.db"
+        self._swap_tokenizer(db_path, "trigram", "pact_missing")
+
+        conn = get_connection(db_path)
+        with patch("scripts.database._init_vector_table", return_value=False):
+            added = create_memory(conn, {"context": "delta added"})
+            update_memory(conn, kept, {"context": "epsilon kept"})
+            assert delete_memory(conn, gone) is True
+            # LIKE fallback sees the writes.
+            assert [m["id"] for m in search_memories_by_text(conn, "delta")] == [added]
+        assert conn.execute("SELECT COUNT(*) FROM memories_search_stale").fetchone()[0] == 1
+        conn.close()
+
+        self._swap_tokenizer(db_path, "pact_missing", "trigram")
+        conn = get_connection(db_path)
+        with patch("scripts.database._init_vector_table", return_value=False):
+            assert [m["id"] for m in search_memories_by_text(conn, "delta")] == [added]
+            assert [m["id"] for m in search_memories_by_text(conn, "epsilon")] == [kept]
+        assert conn.execute("SELECT COUNT(*) FROM memories_search_stale").fetchone()[0] == 0
+        assert conn.execute(
+            "SELECT rowid FROM memories_fts WHERE memories_fts MATCH '\"gone\"'"
+        ).fetchall() == []
+        conn.close()
+
+    def test_legacy_sync_triggers_dropped(self, fts_conn, tmp_path):
+        """Triggers from the earlier trigger-synced schema are removed on init."""
+        from scripts.database import create_memory, ensure_initialized, get_connection
+        fts_conn.execute(
+            "CREATE TRIGGER memories_fts_ai AFTER INSERT ON memories BEGIN "
+            "INSERT INTO memories_fts(rowid, context) VALUES (new.rowid, new.context); END"
+        )
+        fts_conn.commit()
+        fts_conn.close()
+
+        conn = get_connection(tmp_path / "fts.db")
+        with patch("scripts.database._init_vector_table", return_value=False):
+            ensure_initialized(conn)
+            create_memory(conn, {"context": "zeta once"})
+        assert conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+        ).fetchall() == []
+        assert len(conn.execute(
+            "SELECT rowid FROM memories_fts WHERE memories_fts MATCH '\"zeta\"'"
+        ).fetchall()) == 1
+        conn.close()
+
+
 # ---------------------------------------------------------------------------
 # Maintenance
 # ---------------------------------------------------------------------------
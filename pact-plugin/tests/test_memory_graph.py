@@ -11,6 +11,7 @@ Tests cover:
 7. link_memory_to_files: multiple files, partial duplicates
 8. link_memory_to_paths: tracks and links
 9. get_files_for_memory: linked files, no files
+   (and the batched get_file_paths_for_memories)
 10. get_memories_for_file: linked memories, no memories
 11. get_memories_for_files: multiple paths
 12. add_file_relation: new relation, duplicate
@@ -287,6 +288,33 @@ class TestGetFilesForMemory:
         assert get_files_for_memory(db_conn, "mem-1") == []
 
 
+class TestGetFilePathsForMemories:
+    def test_matches_per_memory_lookup(self, db_conn):
+        from scripts.graph import (
+            get_file_paths_for_memories, get_files_for_memory,
+            link_memory_to_file, track_file,
+        )
+        for mem in ("mem-1", "mem-2", "mem-3"):
+            _insert_memory(db_conn, mem)
+        id_a = track_file(db_conn, "/src/a.py")
+        id_b = track_file(db_conn, "/src/b.py")
+        link_memory_to_file(db_conn, "mem-1", id_b, "referenced")
+        link_memory_to_file(db_conn, "mem-1", id_a)
+        link_memory_to_file(db_conn, "mem-2", id_a)
+
+        result = get_file_paths_for_memories(db_conn, ["mem-1", "mem-2", "mem-3"])
+
+        assert result == {
+            mem: [f["path"] for f in get_files_for_memory(db_conn, mem)]
+            for mem in ("mem-1", "mem-2", "mem-3")
+        }
+        assert result["mem-3"] == []
+
+    def test_empty_input(self, db_conn):
+        from scripts.graph import get_file_paths_for_memories
+        assert get_file_paths_for_memories(db_conn, []) == {}
+
+
 # ---------------------------------------------------------------------------
 # get_memories_for_file
 # ---------------------------------------------------------------------------
@@ -6,6 +6,7 @@ Tests cover:
 2. Decision: from_dict (dict + string), to_dict, rationale/alternatives
 3. Entity: from_dict (dict + string), to_dict, type/notes
 4. _parse_string_list: None, list, JSON string, plain string, edge cases
+   (and _parse_object_list for task/decision/entity lists)
 5. _parse_datetime: None, datetime obj, ISO string, common formats
 6. MemoryObject: from_dict (all field types), to_dict, to_storage_dict,
    get_searchable_text, __repr__, JSON string handling
@@ -172,6 +173,38 @@ class TestParseStringList:
         from scripts.models import _parse_string_list
         assert _parse_string_list([1, 2]) == ["1", "2"]
 
+    def test_string_list_returned_as_copy(self):
+        from scripts.models import _parse_string_list
+        raw = ["a", "b"]
+        result = _parse_string_list(raw)
+        assert result == raw
+        assert result is not raw
+
+
+# ---------------------------------------------------------------------------
+# _parse_object_list
+# ---------------------------------------------------------------------------
+
+class TestParseObjectList:
+    def test_falsy_returns_empty(self):
+        from scripts.models import _parse_object_list
+        assert _parse_object_list(None, "task") == []
+        assert _parse_object_list("", "task") == []
+
+    def test_list_passthrough(self):
+        from scripts.models import _parse_object_list
+        items = [{"task": "a"}, None]
+        assert _parse_object_list(items, "task") is items
+
+    def test_json_array_string(self):
+        from scripts.models import _parse_object_list
+        assert _parse_object_list('[{"name": "X"}]', "name") == [{"name": "X"}]
+
+    def test_plain_and_non_array_json_wrapped(self):
+        from scripts.models import _parse_object_list
+        assert _parse_object_list("do it", "decision") == [{"decision": "do it"}]
+        assert _parse_object_list('{"a": 1}', "decision") == [{"decision": '{"a": 1}'}]
+
 
 # ---------------------------------------------------------------------------
 # _parse_datetime
@@ -198,6 +231,24 @@ class TestParseDatetime:
         from scripts.models import _parse_datetime
         result = _parse_datetime("2024-01-15T10:30:00Z")
         assert result is not None
+        assert result.utcoffset().total_seconds() == 0
+
+    def test_repeated_string_served_from_cache(self):
+        from scripts.models import _parse_datetime
+        first = _parse_datetime("2024-02-01T08:00:00+00:00")
+        assert _parse_datetime("2024-02-01T08:00:00+00:00") is first
+
+    def test_c_parser_rejection_falls_back_to_stdlib(self, monkeypatch):
+        import scripts.models as models
+
+        def reject(value):
+            raise ValueError(value)
+
+        monkeypatch.setattr(models, "_parse_iso_c", reject)
+        models._parse_datetime_str.cache_clear()
+        result = models._parse_datetime("2024-03-05T06:07:08Z")
+        models._parse_datetime_str.cache_clear()
+        assert result == datetime(2024, 3, 5, 6, 7, 8, tzinfo=timezone.utc)
 
     def test_datetime_format(self):
         from scripts.models import _parse_datetime
@@ -231,6 +282,13 @@ class TestMemoryObject:
         assert m.active_tasks == []
         assert m.lessons_learned == []
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots are 3.10+")
+    def test_models_are_slotted(self):
+        from scripts.models import Decision, Entity, MemoryObject, TaskItem
+        for obj in (TaskItem(task="t"), Decision(decision="d"), Entity(name="e"),
+                    MemoryObject(id="m")):
+            assert not hasattr(obj, "__dict__")
+
     def test_from_dict_full(self):
         from scripts.models import MemoryObject
         data = {
@@ -310,6 +368,25 @@ class TestMemoryObject:
         assert len(m.decisions) == 0
         assert len(m.entities) == 0
 
+    def test_from_dict_mixed_string_and_dict_items(self):
+        from scripts.models import MemoryObject
+        data = {
+            "id": "abc",
+            "active_tasks": ["plain", {"task": "T", "status": "completed"}],
+            "decisions": ["D1", {"decision": "D2", "rationale": "R"}],
+            "entities": ["E1", {"name": "E2", "type": "module"}],
+        }
+        m = MemoryObject.from_dict(data)
+        assert [(t.task, t.status) for t in m.active_tasks] == [
+            ("plain", "pending"), ("T", "completed"),
+        ]
+        assert [(d.decision, d.rationale) for d in m.decisions] == [
+            ("D1", None), ("D2", "R"),
+        ]
+        assert [(e.name, e.type) for e in m.entities] == [
+            ("E1", None), ("E2", "module"),
+        ]
+
     def test_to_dict(self):
         from scripts.models import MemoryObject, TaskItem, Decision
         m = MemoryObject(
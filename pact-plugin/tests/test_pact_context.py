@@ -2737,3 +2737,39 @@ class TestDescribeContextFailure:
 
         result = ctx_module.describe_context_failure()
         assert "context file not found" in result
+
+
+class TestLoadTeamConfig:
+    """load_team_config memoizes the parsed config on (path, mtime, size)."""
+
+    def test_repeat_read_served_from_cache(self, tmp_path, monkeypatch):
+        import shared.pact_context as ctx_module
+
+        config_path = tmp_path / "config.json"
+        config_path.write_text('{"members": []}', encoding="utf-8")
+
+        first = ctx_module.load_team_config(config_path)
+
+        def _no_read(self, *args, **kwargs):
+            raise AssertionError("config re-read despite unchanged stat")
+
+        monkeypatch.setattr(Path, "read_bytes", _no_read)
+        assert ctx_module.load_team_config(config_path) is first
+
+    def test_rewritten_config_is_reparsed(self, tmp_path):
+        import shared.pact_context as ctx_module
+
+        config_path = tmp_path / "config.json"
+        config_path.write_text('{"members": []}', encoding="utf-8")
+        assert ctx_module.load_team_config(config_path) == {"members": []}
+
+        config_path.write_text('{"members": [{"name": "a"}]}', encoding="utf-8")
+        assert ctx_module.load_team_config(config_path) == {
+            "members": [{"name": "a"}]
+        }
+
+    def test_missing_config_raises(self, tmp_path):
+        import shared.pact_context as ctx_module
+
+        with pytest.raises(OSError):
+            ctx_module.load_team_config(tmp_path / "absent.json")
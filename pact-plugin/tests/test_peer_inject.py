@@ -160,17 +160,17 @@ class TestPeerInject:
         team_dir.mkdir(parents=True)
         config_path = team_dir / "config.json"
         # File must exist so the `config_path.exists()` guard passes and
-        # control reaches the read_text() call.
+        # control reaches the read_bytes() call.
         config_path.write_text('{"members": []}', encoding="utf-8")
 
-        original_read_text = Path.read_text
+        original_read_bytes = Path.read_bytes
 
-        def raising_read_text(self, *args, **kwargs):
+        def raising_read_bytes(self, *args, **kwargs):
             if self == config_path:
                 raise OSError("simulated permission denied")
-            return original_read_text(self, *args, **kwargs)
+            return original_read_bytes(self, *args, **kwargs)
 
-        monkeypatch.setattr(Path, "read_text", raising_read_text)
+        monkeypatch.setattr(Path, "read_bytes", raising_read_bytes)
 
         result = get_peer_context(
             agent_type="pact-backend-coder",
@@ -306,19 +306,20 @@ class TestSanitizerParity:
     byte-identical to peer_context._sanitize_agent_name (write/read parity)."""
 
     def _sanitizer_charclass(self, rel_file: str) -> str:
-        """Extract the re.sub char-class literal (the one containing \\x00) from
-        the named module's source."""
+        """Extract the sanitizer char-class literal (the one containing \\x00)
+        from the named module's source — passed to ``re.sub`` directly or
+        precompiled via ``re.compile``."""
         tree = _parse(HOOKS_DIR / rel_file)
         for node in ast.walk(tree):
             if (isinstance(node, ast.Call)
                     and isinstance(node.func, ast.Attribute)
-                    and node.func.attr == "sub"
+                    and node.func.attr in ("sub", "compile")
                     and node.args
                     and isinstance(node.args[0], ast.Constant)
                     and isinstance(node.args[0].value, str)
                     and r"\x00" in node.args[0].value):
                 return node.args[0].value
-        raise AssertionError(f"no sanitizer re.sub char-class found in {rel_file}")
+        raise AssertionError(f"no sanitizer char-class found in {rel_file}")
 
     def test_charclass_compiled_identical(self):
         peer = self._sanitizer_charclass("shared/peer_context.py")
@@ -14,6 +14,7 @@ Tests cover:
 """
 
 import inspect
+import json
 import os
 import sys
 import textwrap
@@ -383,6 +384,29 @@ class TestGetProjectClaudeMdPath:
 
         assert result == legacy
 
+    def test_git_root_resolved_once_per_cwd(self, tmp_path, clean_env_no_claude_project_dir):
+        """Repeat resolutions from the same cwd reuse the memoized git root
+        instead of spawning git again; a different cwd re-resolves."""
+        from session_init import _get_project_claude_md_path
+
+        claude_md = tmp_path / "CLAUDE.md"
+        claude_md.write_text("# Test", encoding="utf-8")
+        other = tmp_path / "other"
+        other.mkdir()
+
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = str(tmp_path / ".git") + "\n"
+
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            with patch("pathlib.Path.cwd", return_value=tmp_path):
+                assert _get_project_claude_md_path() == claude_md
+                assert _get_project_claude_md_path() == claude_md
+            assert mock_run.call_count == 1
+            with patch("pathlib.Path.cwd", return_value=other):
+                assert _get_project_claude_md_path() == claude_md
+            assert mock_run.call_count == 2
+
 
 class TestSessionInitEstimateTokens:
     """Tests for _estimate_tokens() in session_init.py (separate copy)."""
@@ -626,6 +650,93 @@ class TestStalenessModuleDirect:
         content = claude_md.read_text(encoding="utf-8")
         assert "<!-- STALE:" not in content
 
+    def test_interleaved_stale_entries_marked_in_place(self):
+        """Markers land under the right headings when stale and fresh
+        entries alternate; everything else is preserved byte-for-byte."""
+        from staleness import apply_staleness_markings, PINNED_STALENESS_DAYS
+
+        old_a = (datetime.now() - timedelta(days=PINNED_STALENESS_DAYS + 10)).strftime("%Y-%m-%d")
+        old_b = (datetime.now() - timedelta(days=PINNED_STALENESS_DAYS + 20)).strftime("%Y-%m-%d")
+        recent = datetime.now().strftime("%Y-%m-%d")
+
+        pinned = (
+            "\n"
+            f"### A (PR #1, merged {old_a})\n- a\n\n"
+            f"### B (PR #2, merged {recent})\n- b\n\n"
+            f"### C (PR #3, merged {old_b})\n- c\n"
+        )
+        content = "## Pinned Context\n" + pinned + "## Next\n"
+        start = len("## Pinned Context\n")
+
+        new_content, stale_count, modified, _ = apply_staleness_markings(
+            content, start, start + len(pinned), pinned
+        )
+
+        assert modified is True
+        assert stale_count == 2
+        assert new_content == (
+            "## Pinned Context\n"
+            "\n"
+            f"### A (PR #1, merged {old_a})\n"
+            f"<!-- STALE: Last relevant {old_a} -->\n- a\n\n"
+            f"### B (PR #2, merged {recent})\n- b\n\n"
+            f"### C (PR #3, merged {old_b})\n"
+            f"<!-- STALE: Last relevant {old_b} -->\n- c\n"
+            "## Next\n"
+        )
+
+        # Second pass: the PR reference precedes each marker, but marked
+        # entries are still recognised and counted, not re-marked.
+        second_pinned = new_content[start:-len("## Next\n")]
+        again, stale_count, modified, _ = apply_staleness_markings(
+            new_content, start, start + len(second_pinned), second_pinned
+        )
+        assert modified is False
+        assert stale_count == 2
+        assert again == new_content
+
+    def test_unchanged_file_served_from_sidecar(self, tmp_path):
+        """A clean pass is recorded; an unchanged file is not re-read, and
+        an edit (new size/mtime) or a stale date key forces a fresh pass."""
+        from staleness import check_pinned_staleness, PINNED_STALENESS_DAYS
+
+        old_date = (datetime.now() - timedelta(days=PINNED_STALENESS_DAYS + 10)).strftime("%Y-%m-%d")
+        claude_md = self._create_claude_md(tmp_path, (
+            "# Project Memory\n\n"
+            "## Pinned Context\n\n"
+            "### Fresh entry\n"
+            "- Details\n\n"
+        ))
+
+        assert check_pinned_staleness(claude_md_path=claude_md) is None
+        sidecar = tmp_path / ".CLAUDE.md.staleness.json"
+        assert sidecar.exists()
+
+        with patch("staleness._parse_pinned_section",
+                   side_effect=AssertionError("re-parsed")):
+            assert check_pinned_staleness(claude_md_path=claude_md) is None
+
+        # Content change -> size/mtime mismatch -> full pass marks the entry.
+        claude_md.write_text(
+            "# Project Memory\n\n"
+            "## Pinned Context\n\n"
+            f"### Old Feature (PR #50, merged {old_date})\n"
+            "- Details\n\n",
+            encoding="utf-8",
+        )
+        result = check_pinned_staleness(claude_md_path=claude_md)
+        assert result is not None and "1 stale" in result
+        assert "<!-- STALE:" in claude_md.read_text(encoding="utf-8")
+
+        # A sidecar from another day is ignored.
+        check_pinned_staleness(claude_md_path=claude_md)
+        cached = json.loads(sidecar.read_text(encoding="utf-8"))
+        cached["date"] = "2000-01-01"
+        cached["message"] = "bogus"
+        sidecar.write_text(json.dumps(cached), encoding="utf-8")
+        result = check_pinned_staleness(claude_md_path=claude_md)
+        assert result is not None and "1 stale" in result
+
     def test_nonexistent_explicit_path_returns_none(self, tmp_path):
         """Passing a path to a non-existent file should return None gracefully."""
         from staleness import check_pinned_staleness
@@ -142,6 +142,30 @@ class TestEnsureInitializedVectorMigration:
         )
 
 
+class TestInitVectorTableDeferredImports:
+    """_init_vector_table only reaches the embeddings backend when needed."""
+
+    def test_disable_env_skips_vector_branch(self, monkeypatch):
+        from scripts.database import _init_vector_table
+
+        monkeypatch.setenv('PACT_DISABLE_VEC', '1')
+        mock_conn = MagicMock()
+        with patch('scripts.database._resolve_embedding_dim') as mock_dim:
+            assert _init_vector_table(mock_conn) is False
+        mock_dim.assert_not_called()
+        mock_conn.enable_load_extension.assert_not_called()
+
+    def test_missing_sqlite_vec_skips_embedding_dim(self, monkeypatch):
+        from scripts.database import _init_vector_table
+
+        monkeypatch.delenv('PACT_DISABLE_VEC', raising=False)
+        with patch('scripts.database.SQLITE_EXTENSIONS_ENABLED', True), \
+             patch.dict('sys.modules', {'sqlite_vec': None}), \
+             patch('scripts.database._resolve_embedding_dim') as mock_dim:
+            assert _init_vector_table(MagicMock()) is False
+        mock_dim.assert_not_called()
+
+
 # =============================================================================
 # 2. maybe_migrate_embeddings() — field completeness
 # =============================================================================
@@ -1196,6 +1220,18 @@ class TestCheckAndMigrateVectorTable:
             sql = str(call_args)
             assert 'DROP TABLE' not in sql
 
+    def test_probe_embedding_is_zeroed_float32(self):
+        """The probe vector is new_dim float32 zeros, byte-for-byte."""
+        from scripts.database import _check_and_migrate_vector_table
+
+        mock_conn = MagicMock()
+        mock_conn.execute.return_value.fetchone.return_value = ('vec_memories',)
+
+        _check_and_migrate_vector_table(mock_conn, 384)
+
+        probe_params = mock_conn.execute.call_args_list[1][0][1]
+        assert probe_params == (struct.pack('384f', *([0.0] * 384)),)
+
     def test_matching_dimensions_is_noop(self):
         """When probe query succeeds, dimensions match — no migration needed."""
         from scripts.database import _check_and_migrate_vector_table